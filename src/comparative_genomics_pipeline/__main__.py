@@ -413,6 +413,7 @@ async def async_main() -> int:
                 return 1
             
             variant_plot_errors = 0
+            scientific_variant_jobs = []
             for gene_name, ortholog_list in genes_to_proteins.items():
                 try:
                     canonical = next((
@@ -441,7 +442,7 @@ async def async_main() -> int:
                         
                         logger.info(f"Generating variant plots for {gene_name}...")
                         biopython_service.plot_variants_on_conservation(conservation_csv, variants_csv, output_dir)
-                        biopython_service.plot_variants_scientific(conservation_csv, variants_csv, output_dir)
+                        scientific_variant_jobs.append((conservation_csv, variants_csv))
                         
                     else:
                         logger.warning(f"No UniProt ID found for {gene_name}. Skipping variant plots.")
@@ -451,6 +452,11 @@ async def async_main() -> int:
                     variant_plot_errors += 1
                     continue
             
+            # Scientific overlays are independent per gene; render them in parallel
+            variant_plot_errors += biopython_service.plot_all_variants_scientific(
+                scientific_variant_jobs, path_config.VARIANTS_OUTPUT_DIR
+            )
+            
             if variant_plot_errors > 0:
                 logger.warning(f"Variant plot generation completed with {variant_plot_errors} errors")
                 
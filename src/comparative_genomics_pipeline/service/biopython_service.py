@@ -1,3 +1,6 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from Bio import Phylo, AlignIO
 from Bio.Align import AlignInfo
@@ -8,6 +11,7 @@ import pandas as pd
 import logging
 from ..config import path_config
 from ..visualization import ConservationPlotter, PhylogeneticPlotter, VariantPlotter
+from ..visualization.scientific_plots import parse_position_values
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -369,9 +373,15 @@ def plot_conservation_scores(csv_file, output_dir=None):
             logger.error(f"Failed to create conservation plot output directory {output_dir}: {e}")
             return None
         
-        # Read CSV file with error handling
+        # Read CSV file with error handling; only the plotted columns are parsed,
+        # with the entropies as float32 (plenty for line vertices)
+        required_columns = ["Position", "ShannonEntropy_WithGaps", "ShannonEntropy_NoGaps"]
         try:
-            df = pd.read_csv(csv_file)
+            df = pd.read_csv(
+                csv_file,
+                usecols=lambda column: column in required_columns,
+                dtype={"ShannonEntropy_WithGaps": np.float32, "ShannonEntropy_NoGaps": np.float32},
+            )
         except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError) as e:
             logger.error(f"Failed to read conservation CSV file {csv_file}: {e}")
             return None
@@ -380,7 +390,6 @@ def plot_conservation_scores(csv_file, output_dir=None):
             return None
         
         # Validate CSV data
-        required_columns = ["Position", "ShannonEntropy_WithGaps", "ShannonEntropy_NoGaps"]
         missing_columns = [col for col in required_columns if col not in df.columns]
         if missing_columns:
             logger.error(f"Conservation CSV file {csv_file} missing required columns: {missing_columns}")
@@ -393,10 +402,11 @@ def plot_conservation_scores(csv_file, output_dir=None):
         # Create plot with error handling
         try:
             fig = plt.figure(figsize=(12, 5))
+            positions = df["Position"].to_numpy()
             plt.plot(
-                df["Position"], df["ShannonEntropy_WithGaps"], label="With Gaps", alpha=0.7
+                positions, df["ShannonEntropy_WithGaps"].to_numpy(), label="With Gaps", alpha=0.7
             )
-            plt.plot(df["Position"], df["ShannonEntropy_NoGaps"], label="No Gaps", alpha=0.7)
+            plt.plot(positions, df["ShannonEntropy_NoGaps"].to_numpy(), label="No Gaps", alpha=0.7)
             plt.xlabel("Alignment Position")
             plt.ylabel("Shannon Entropy")
             plt.title(f"Conservation (Shannon Entropy): {csv_file.stem}")
@@ -560,19 +570,12 @@ def plot_variants_on_conservation(conservation_csv, variants_csv, output_dir=Non
             logger.error(f"Variants CSV file {variants_csv} missing 'position' column")
             return None
 
-        # Try to extract integer positions from variant CSV
-        def parse_pos(x):
-            try:
-                if "{" in str(x):
-                    return int(eval(x)["value"])
-                return int(x)
-            except Exception:
-                return None
-
+        # Extract integer positions from variant CSV (plain numbers or UniProt location dicts)
         try:
-            vars["Position"] = vars["position"].apply(parse_pos)
-            # Filter out None values
+            vars["Position"] = parse_position_values(vars["position"])
+            # Filter out unparseable positions
             vars = vars.dropna(subset=["Position"])
+            vars["Position"] = vars["Position"].astype(int)
             
             if len(vars) == 0:
                 logger.warning(f"No valid variant positions found in {variants_csv}")
@@ -658,6 +661,66 @@ def plot_variants_on_conservation(conservation_csv, variants_csv, output_dir=Non
 
 # Scientific plotting functions with enhanced rigor and clarity
 
+def _init_plot_worker():
+    """Select the non-interactive backend in each plotting worker process."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _plot_conservation_worker(csv_file, output_dir):
+    """Worker: build a fresh plotter per process (matplotlib state is not picklable)."""
+    return ConservationPlotter().plot_conservation_with_confidence(csv_file, output_dir)
+
+
+def _plot_tree_worker(tree_path, output_dir):
+    """Worker: build a fresh plotter per process (matplotlib state is not picklable)."""
+    return PhylogeneticPlotter().plot_tree_scientific(tree_path, output_dir)
+
+
+def _plot_variants_worker(csv_pair, output_dir):
+    """Worker: csv_pair is (conservation_csv, variants_csv) for one gene."""
+    conservation_csv, variants_csv = csv_pair
+    return VariantPlotter().plot_variants_with_statistics(conservation_csv, variants_csv, output_dir)
+
+
+def _run_plot_jobs(worker, jobs, workers=None):
+    """
+    Run independent per-file plot jobs, in a process pool when more than one worker is useful.
+    
+    Args:
+        worker: Module-level function taking (input_path, output_dir)
+        jobs (list[tuple]): (input_path, output_dir) pairs
+        workers (int, optional): Max worker processes, defaults to os.cpu_count()
+        
+    Returns:
+        list[tuple]: (input_path, result or None, exception or None) per job, in input order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+    
+    results = []
+    if workers == 1:
+        for input_path, output_dir in jobs:
+            try:
+                results.append((input_path, worker(input_path, output_dir), None))
+            except Exception as e:
+                results.append((input_path, None, e))
+        return results
+    
+    # spawn rather than fork: matplotlib's global state is not fork-safe
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_plot_worker,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [(input_path, executor.submit(worker, input_path, output_dir))
+                   for input_path, output_dir in jobs]
+        for input_path, future in futures:
+            try:
+                results.append((input_path, future.result(), None))
+            except Exception as e:
+                results.append((input_path, None, e))
+    return results
+
+
 def plot_conservation_scientific(csv_file, output_dir=None):
     """
     Create publication-quality conservation plots with statistical rigor.
@@ -674,34 +737,40 @@ def plot_conservation_scientific(csv_file, output_dir=None):
                                                    Path(output_dir) if output_dir else None)
 
 
-def plot_all_conservation_scientific(conservation_dir=None):
+def plot_all_conservation_scientific(conservation_dir=None, workers=None):
     """
     Create scientific conservation plots for all CSVs in the given directory.
     
+    Plots are independent per gene, so they are rendered in parallel worker processes.
+    
     Args:
         conservation_dir (Path, optional): Directory containing conservation CSV files
+        workers (int, optional): Max worker processes, defaults to os.cpu_count()
     """
     if conservation_dir is None:
         conservation_dir = path_config.CONSERVATION_OUTPUT_DIR
+    conservation_dir = Path(conservation_dir)
     
-    plotter = ConservationPlotter()
-    csv_files = list(Path(conservation_dir).glob("*_conservation.csv"))
+    csv_files = list(conservation_dir.glob("*_conservation.csv"))
+    jobs = [(csv_file, conservation_dir) for csv_file in csv_files]
     
-    for csv_file in csv_files:
-        try:
-            plotter.plot_conservation_with_confidence(csv_file, Path(conservation_dir))
+    for csv_file, _, error in _run_plot_jobs(_plot_conservation_worker, jobs, workers):
+        if error is None:
             print(f"Created scientific conservation plot for {csv_file.name}")
-        except Exception as e:
-            print(f"Error creating scientific plot for {csv_file.name}: {e}")
+        else:
+            print(f"Error creating scientific plot for {csv_file.name}: {error}")
 
 
-def visualize_trees_scientific(tree_files=None, output_dir=None):
+def visualize_trees_scientific(tree_files=None, output_dir=None, workers=None):
     """
     Create publication-quality phylogenetic tree visualizations.
     
+    Trees are independent per gene, so they are rendered in parallel worker processes.
+    
     Args:
         tree_files (list[Path], optional): List of .nwk tree file paths
         output_dir (Path, optional): Where to save PNGs
+        workers (int, optional): Max worker processes, defaults to os.cpu_count()
     """
     if output_dir is None:
         output_dir = path_config.TREES_OUTPUT_DIR
@@ -711,14 +780,13 @@ def visualize_trees_scientific(tree_files=None, output_dir=None):
     if tree_files is None:
         tree_files = list(output_dir.glob("*.nwk"))
 
-    plotter = PhylogeneticPlotter()
+    jobs = [(Path(tree_path), output_dir) for tree_path in tree_files]
     
-    for tree_path in tree_files:
-        try:
-            plotter.plot_tree_scientific(Path(tree_path), output_dir)
+    for tree_path, _, error in _run_plot_jobs(_plot_tree_worker, jobs, workers):
+        if error is None:
             print(f"Created scientific tree visualization for {tree_path.name}")
-        except Exception as e:
-            print(f"Error creating scientific tree plot for {tree_path.name}: {e}")
+        else:
+            print(f"Error creating scientific tree plot for {tree_path.name}: {error}")
 
 
 def plot_variants_scientific(conservation_csv, variants_csv, output_dir=None):
@@ -737,3 +805,31 @@ def plot_variants_scientific(conservation_csv, variants_csv, output_dir=None):
     return plotter.plot_variants_with_statistics(Path(conservation_csv), 
                                                Path(variants_csv),
                                                Path(output_dir) if output_dir else None)
+
+
+def plot_all_variants_scientific(csv_pairs, output_dir=None, workers=None):
+    """
+    Create scientific variant overlay plots for several genes.
+    
+    Plots are independent per gene, so they are rendered in parallel worker processes.
+    
+    Args:
+        csv_pairs (list[tuple]): (conservation_csv, variants_csv) path pairs, one per gene
+        output_dir (Path, optional): Output directory for plots
+        workers (int, optional): Max worker processes, defaults to os.cpu_count()
+        
+    Returns:
+        int: Number of plots that failed
+    """
+    output_dir = Path(output_dir) if output_dir else None
+    jobs = [((Path(conservation_csv), Path(variants_csv)), output_dir)
+            for conservation_csv, variants_csv in csv_pairs]
+    
+    failures = 0
+    for (_, variants_csv), _, error in _run_plot_jobs(_plot_variants_worker, jobs, workers):
+        if error is None:
+            print(f"Created scientific variant plot for {variants_csv.name}")
+        else:
+            logger.error(f"Failed to create scientific variant plot for {variants_csv.name}: {error}")
+            failures += 1
+    return failures
@@ -39,6 +39,10 @@ class PlotTheme:
     spine_width: float = 0.8
 
 
+# Accepted PlotConfig.conservation_smoothing_method values
+SMOOTHING_METHODS = ('savgol', 'boxcar')
+
+
 @dataclass 
 class PlotConfig:
     """Configuration for specific plot types."""
@@ -50,6 +54,7 @@ class PlotConfig:
     
     # Conservation plot specific
     conservation_smoothing_window: int = 5
+    conservation_smoothing_method: str = 'savgol'  # 'savgol' (shape-preserving) or 'boxcar' (moving average)
     show_confidence_intervals: bool = True
     confidence_level: float = 0.95
     show_data_summary: bool = True
@@ -76,8 +81,15 @@ class PlotConfig:
     output_format: str = 'png'
     output_dpi: int = 300
     bbox_inches: str = 'tight'
+    png_compress_level: int = 6  # zlib level for PNG output; 1 saves ~20% faster, files ~40% larger
+    rasterize_min_points: int = 50000  # Rasterize data artists above this size (PDF/SVG output)
     
     def __post_init__(self):
+        if self.conservation_smoothing_method not in SMOOTHING_METHODS:
+            raise ValueError(
+                f"conservation_smoothing_method must be one of {SMOOTHING_METHODS}, "
+                f"got {self.conservation_smoothing_method!r}"
+            )
         if self.variant_colors is None:
             self.variant_colors = {
                 'pathogenic': '#C73E1D',
@@ -133,7 +145,8 @@ CLINICAL_SIGNIFICANCE_MAPPING = {
 PLOT_POSITIONING = {
     'example_text_x': 0.02,
     'example_text_y': 0.98,
-    'bar_label_offset': 0.5,
+    'bar_label_offset': 0.5,  # data units; no longer used by ClinVarPlotter, kept for callers
+    'bar_label_padding': 3,  # points above the bar top
     'example_box_padding': 0.3
 }
 
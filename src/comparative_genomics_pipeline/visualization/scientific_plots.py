@@ -2,50 +2,542 @@
 Scientific plotting classes for comparative genomics with statistical rigor.
 """
 
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict, Any, Union
 import numpy as np
 import pandas as pd
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from scipy import stats
-from scipy.signal import savgol_filter
-from Bio import Phylo
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below fall back to numpy/Python
+    njit = None
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; large ClinVar CSVs fall back to pandas
+    pl = None
 
 from .plot_config import PlotConfig, PlotTheme, PUBLICATION_THEME, CLINICAL_SIGNIFICANCE_MAPPING, PLOT_POSITIONING
 
 
+# Description phrases used to classify variants from raw UniProt data
+# (matched as lowercase substrings; positions are never hardcoded)
+_LOF_INDICATORS = (
+    'loss of function',
+    'loss-of-function',
+    'non-functional channel',
+    'results in a non-functional channel',
+    'complete absence of sodium current',
+    'absence of sodium current',
+    'complete loss of sodium ion transmembrane transport',
+    'complete loss of sodium',
+)
+
+_REDUCED_FUNCTION_INDICATORS = (
+    'reduced function',
+    'decreased peak current',
+    'impaired channel',
+    'reduced current',
+)
+
+_LOF_RE = re.compile('|'.join(re.escape(term) for term in _LOF_INDICATORS))
+_REDUCED_FUNCTION_RE = re.compile('|'.join(re.escape(term) for term in _REDUCED_FUNCTION_INDICATORS))
+
+
+def _rolling_std_centered_kernel(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    Centered rolling sample std (ddof=1) with min_periods=1 semantics.
+    
+    Matches pd.Series(x).rolling(w, center=True, min_periods=1).std(): position i
+    covers x[i - w//2 : i + (w-1)//2 + 1] clipped to the array, NaNs are skipped,
+    and windows holding fewer than two values give NaN. Uses running sums shifted
+    by the first non-NaN value to limit cancellation.
+    """
+    n = x.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    shift = 0.0
+    for j in range(n):
+        if not np.isnan(x[j]):
+            shift = x[j]
+            break
+    half_left = w // 2
+    half_right = (w - 1) // 2
+    s = 0.0
+    s2 = 0.0
+    count = 0  # non-NaN values in the window
+    lo = 0
+    hi = 0  # window is x[lo:hi]
+    for i in range(n):
+        new_hi = min(n, i + half_right + 1)
+        while hi < new_hi:
+            v = x[hi] - shift
+            if not np.isnan(v):
+                s += v
+                s2 += v * v
+                count += 1
+            hi += 1
+        new_lo = max(0, i - half_left)
+        while lo < new_lo:
+            v = x[lo] - shift
+            if not np.isnan(v):
+                s -= v
+                s2 -= v * v
+                count -= 1
+            lo += 1
+        if count < 2:
+            out[i] = np.nan
+        else:
+            var = (s2 - s * s / count) / (count - 1)
+            out[i] = np.sqrt(var) if var > 0.0 else 0.0
+    return out
+
+
+def _rolling_std_centered_numpy(x: np.ndarray, w: int) -> np.ndarray:
+    """Vectorized equivalent of _rolling_std_centered_kernel for use without numba.
+
+    Window sums come from cumulative sums of the mean-shifted values (and their
+    squares), so each output is two subtractions instead of a pandas rolling pass.
+    NaNs contribute to neither the sums nor the per-window counts.
+    """
+    n = x.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    valid = ~np.isnan(x)
+    if not valid.any():
+        return np.full(n, np.nan)
+    d = np.where(valid, x - np.nanmean(x), 0.0)
+    csum = np.zeros(n + 1, dtype=np.float64)
+    csum2 = np.zeros(n + 1, dtype=np.float64)
+    ccount = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(d, out=csum[1:])
+    np.cumsum(d * d, out=csum2[1:])
+    np.cumsum(valid, out=ccount[1:])
+    idx = np.arange(n)
+    lo = np.maximum(idx - w // 2, 0)
+    hi = np.minimum(idx + (w - 1) // 2 + 1, n)
+    count = ccount[hi] - ccount[lo]
+    s = csum[hi] - csum[lo]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var = (csum2[hi] - csum2[lo] - s * s / count) / (count - 1)
+    out = np.sqrt(np.maximum(var, 0.0))
+    out[count < 2] = np.nan
+    return out
+
+
+_rolling_std_centered = (njit(cache=True)(_rolling_std_centered_kernel) if njit is not None
+                         else _rolling_std_centered_numpy)
+
+
+def _cluster_starts_kernel(cluster_ends: np.ndarray) -> np.ndarray:
+    """Start index of each greedy cluster, given each index's cluster end.
+
+    Hops from one cluster start to the next (cluster_ends[start]), so the
+    sweep takes one step per cluster.
+    """
+    n = cluster_ends.shape[0]
+    starts = np.empty(n, dtype=np.int64)
+    count = 0
+    i = 0
+    while i < n:
+        starts[count] = i
+        count += 1
+        i = cluster_ends[i]
+    return starts[:count]
+
+
+# Compiled when numba is available; the plain kernel is the (slower) fallback
+_cluster_starts = njit(cache=True)(_cluster_starts_kernel) if njit is not None else _cluster_starts_kernel
+
+
+def _mean_var(a: np.ndarray) -> Tuple[float, float]:
+    """Mean and sample variance (ddof=1) from one sum / sum-of-squares pass.
+
+    Values are shifted by a[0] first so the sum-of-squares form does not lose
+    precision when the spread is small relative to the mean.
+    """
+    n = a.size
+    d = a - a[0]
+    s = d.sum()
+    s2 = np.einsum('i,i->', d, d)
+    return a[0] + s / n, (s2 - s * s / n) / (n - 1)
+
+
+# Conservation CSV columns the plotters read (ConsensusResidue is never plotted)
+_CONSERVATION_COLUMNS = ('Position', 'ShannonEntropy_WithGaps', 'ShannonEntropy_NoGaps')
+
+
+def _vertical_lines(ax: plt.Axes, x: np.ndarray, ymin: float, ymax: float,
+                    **kwargs) -> LineCollection:
+    """Equivalent of ax.vlines(x, ymin, ymax, **kwargs) for scalar ymin/ymax.
+
+    Axes.vlines builds its segments through a per-line masked-array loop; here
+    the (N, 2, 2) segment array is filled in one NumPy pass and handed to a
+    single LineCollection. add_collection only autoscales the view itself
+    from matplotlib 3.11 on, so the view is rescaled explicitly like vlines does.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    segments = np.empty((x.size, 2, 2))
+    segments[:, :, 0] = x[:, None]
+    segments[:, 0, 1] = ymin
+    segments[:, 1, 1] = ymax
+    lines = LineCollection(segments, **kwargs)
+    ax.add_collection(lines)
+    ax.autoscale_view()
+    return lines
+
+
+# Theoretical maximum Shannon entropy over the 20 amino acids, in bits
+_MAX_ENTROPY_AA = float(np.log2(20))
+
+
+@lru_cache(maxsize=8)
+def _z_score(confidence_level: float) -> float:
+    """Two-sided normal critical value for a confidence level (e.g. 0.95 -> 1.96).
+
+    Cached because norm.ppf goes through scipy's rv_continuous dispatch and
+    the level only changes with the plot configuration.
+    """
+    from scipy import stats
+
+    return float(stats.norm.ppf(1 - (1 - confidence_level) / 2))
+
+
+def _boxcar_smooth(values: np.ndarray, window: int) -> np.ndarray:
+    """Centered moving average along the last axis from one cumulative sum.
+
+    The window shrinks at the edges (like a centered rolling mean with
+    min_periods=1), so the output keeps the input length.
+    """
+    half = window // 2
+    n = values.shape[-1]
+    csum = np.zeros(values.shape[:-1] + (n + 1,), dtype=np.float64)
+    np.cumsum(values, axis=-1, out=csum[..., 1:])
+    idx = np.arange(n)
+    lo = np.maximum(idx - half, 0)
+    hi = np.minimum(idx + half + 1, n)
+    return ((csum[..., hi] - csum[..., lo]) / (hi - lo)).astype(values.dtype, copy=False)
+
+
+def _sorted_membership(values: np.ndarray, sorted_unique: np.ndarray) -> np.ndarray:
+    """np.isin(values, sorted_unique) for an already sorted, de-duplicated lookup array.
+
+    One binary search per value instead of np.isin's per-element comparison
+    passes; the classification lists it is used with are small and pre-sorted.
+    """
+    if sorted_unique.size == 0:
+        return np.zeros(np.shape(values), dtype=bool)
+    idx = np.searchsorted(sorted_unique, values)
+    idx[idx == sorted_unique.size] = sorted_unique.size - 1
+    return sorted_unique[idx] == values
+
+
+@lru_cache(maxsize=32)
+def _load_conservation(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """Load a conservation CSV as a Position-indexed DataFrame.
+
+    Cached on (path, mtime) so the conservation and variant plots for the same
+    gene share one parse; a rewritten CSV gets a new mtime and is re-read.
+    Only the columns in _CONSERVATION_COLUMNS are parsed. Callers must treat
+    the returned frame as read-only.
+    """
+    df = pd.read_csv(path_str, usecols=lambda column: column in _CONSERVATION_COLUMNS)
+    # Stable sort keeps file order among duplicate positions ("first row wins")
+    return df.set_index('Position', drop=False).sort_index(kind='stable')
+
+
+@dataclass(frozen=True)
+class _ConservationArrays:
+    """Contiguous, read-only plotting columns of one conservation CSV.
+
+    Positions are int32 and entropies float32 - plenty for line vertices; the
+    variant statistics keep reading the float64 DataFrame.
+    """
+    positions: np.ndarray
+    entropy_gaps: np.ndarray
+    entropy_nogaps: np.ndarray
+
+
+@lru_cache(maxsize=32)
+def _load_conservation_arrays(path_str: str, mtime_ns: int) -> _ConservationArrays:
+    """Column arrays of _load_conservation(path_str, mtime_ns), converted once.
+
+    Cached on the same key, so the conservation and variant plots of a gene
+    share one float32 conversion as well as one parse.
+    """
+    df = _load_conservation(path_str, mtime_ns)
+    columns = [
+        np.ascontiguousarray(df['Position'].to_numpy(dtype=np.int32)),
+        np.ascontiguousarray(df['ShannonEntropy_WithGaps'].to_numpy(dtype=np.float32)),
+        np.ascontiguousarray(df['ShannonEntropy_NoGaps'].to_numpy(dtype=np.float32)),
+    ]
+    for column in columns:
+        column.setflags(write=False)
+    return _ConservationArrays(*columns)
+
+
+# The only ClinVar CSV column the comparison plot reads
+_CLINVAR_COLUMNS = ('clinical_significance',)
+
+# Above this size ClinVar CSVs are parsed with polars' multi-threaded reader (if installed)
+_POLARS_MIN_BYTES = 1_000_000
+
+
+@lru_cache(maxsize=32)
+def _load_clinvar(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """Load a ClinVar variants CSV, cached on (path, mtime) like _load_conservation.
+
+    Only the columns in _CLINVAR_COLUMNS are parsed (as strings); a file
+    without them loads as an empty frame. Large exports go through a lazy
+    polars scan with the same projection when polars is available. Callers
+    must treat the returned frame as read-only.
+    """
+    if pl is not None and Path(path_str).stat().st_size > _POLARS_MIN_BYTES:
+        scan = pl.scan_csv(path_str, infer_schema=False)  # all columns as strings
+        columns = [c for c in scan.collect_schema().names() if c in _CLINVAR_COLUMNS]
+        if not columns:
+            return pd.DataFrame()
+        collected = scan.select(columns).collect()
+        # Column-wise to_numpy rather than to_pandas, which would require pyarrow
+        return pd.DataFrame({c: collected[c].to_numpy() for c in columns}).astype('string')
+    
+    return pd.read_csv(path_str, usecols=lambda column: column in _CLINVAR_COLUMNS, dtype='string')
+
+
+# The 'value' entry of a UniProt location dict serialized with str()
+_POSITION_VALUE_RE = re.compile(r"""['"]value['"]\s*:\s*(\d+)""")
+
+
+def parse_position_values(positions: pd.Series) -> pd.Series:
+    """Parse variant positions column-wise; NaN where a value cannot be parsed.
+
+    Handles plain numbers and UniProt location dicts serialized as strings
+    (e.g. "{'value': 123, 'modifier': 'EXACT'}") without eval or per-row apply.
+    """
+    parsed = pd.to_numeric(positions, errors='coerce')
+    
+    # Only rows that failed numeric parsing can hold a location dict; a purely
+    # numeric column never gets converted to strings
+    unparsed = parsed.isna() & positions.notna()
+    if not unparsed.any():
+        return parsed
+    
+    as_str = positions[unparsed].astype(str)
+    dict_rows = as_str[as_str.str.contains('{', regex=False)]
+    if len(dict_rows):
+        extracted = dict_rows.str.extract(_POSITION_VALUE_RE, expand=False)
+        parsed = parsed.astype(float)
+        parsed.loc[dict_rows.index] = pd.to_numeric(extracted, errors='coerce')
+    
+    return parsed
+
+
+# ClinVar significance substrings in match priority: compound classes first, then
+# the simple mapping keys in declaration order (first match wins)
+_SIGNIFICANCE_PATTERNS = (
+    ('likely pathogenic', CLINICAL_SIGNIFICANCE_MAPPING['likely_pathogenic']),
+    ('likely benign', CLINICAL_SIGNIFICANCE_MAPPING['likely_benign']),
+) + tuple(
+    (key_pattern, display_name)
+    for key_pattern, display_name in CLINICAL_SIGNIFICANCE_MAPPING.items()
+    if key_pattern not in ('likely_pathogenic', 'likely_benign')
+)
+_OTHER_SIGNIFICANCE = CLINICAL_SIGNIFICANCE_MAPPING['other']
+# Display classes in mapping order; fixes the bar order of every ClinVar subplot
+_ORDERED_CATEGORIES = tuple(dict.fromkeys(CLINICAL_SIGNIFICANCE_MAPPING.values()))
+
+
+@lru_cache(maxsize=512)
+def _classify_significance_cached(sig_lower: str) -> str:
+    """Map a lower-cased ClinVar significance string to its display class.
+
+    Cached because significance strings come from a small vocabulary.
+    """
+    for pattern, display_name in _SIGNIFICANCE_PATTERNS:
+        if pattern in sig_lower:
+            return display_name
+    
+    return _OTHER_SIGNIFICANCE
+
+
+# Common names for the species abbreviations used in tree labels
+_SPECIES_COMMON_NAMES = {
+    "H. sapiens": "Human",
+    "M. musculus": "Mouse",
+    "M. mulatta": "Macaque",
+    "G. gallus": "Chicken",
+    "P. major": "Great Tit"
+}
+
+
+@lru_cache(maxsize=1)
+def _load_species_name_map() -> Dict[str, Dict[str, str]]:
+    """
+    Build the protein ID -> species label mapping from genes_to_proteins.json.
+    
+    Loaded once per process (tree labelling calls this once per clade); call
+    _load_species_name_map.cache_clear() after changing the input file.
+    
+    Returns:
+        Mapping in configuration order; the first ID found in a clade name wins
+    """
+    from ..config import path_config
+    from ..util import file_util
+    
+    genes_to_proteins = file_util.open_file_return_as_json(
+        f"{path_config.DATA_INPUT_DIR}/genes_to_proteins.json"
+    ) or {}
+    
+    # Build dynamic mapping from protein IDs to species info
+    name_map = {}
+    for gene_name, orthologs in genes_to_proteins.items():
+        for ortholog in orthologs:
+            species_full = ortholog["species"]
+            # Convert "Homo sapiens" to "H. sapiens"
+            parts = species_full.split()
+            species_abbrev = f"{parts[0][0]}. {parts[1]}" if len(parts) >= 2 else species_full
+            common_name = _SPECIES_COMMON_NAMES.get(species_abbrev, species_abbrev)
+            
+            for id_field in ("uniprot_id", "entrez_protein_id"):
+                protein_id = ortholog.get(id_field)
+                if protein_id:
+                    name_map[protein_id] = {
+                        "species": species_abbrev,
+                        "common": common_name,
+                        "protein_id": protein_id
+                    }
+    
+    return name_map
+
+
+# Batch-rendering settings for the scientific figures only: simplify dense line
+# paths (thousands of variant lines per figure) and skip font hinting
+_BATCH_RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'text.hinting': 'none',
+}
+
+
+def _batch_rendering(method):
+    """Run a plot method under _BATCH_RC_PARAMS, restoring the caller's rcParams after.
+
+    Paths read the simplification settings when they are created and Agg reads
+    the rest when drawing, so the context spans both figure building and saving.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with mpl.rc_context(_BATCH_RC_PARAMS):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class BasePlotter:
-    """Base class for scientific plotters with common functionality."""
+    """Base class for scientific plotters with common functionality.
+
+    Plotters render off-screen: figures are drawn on their own Agg canvases
+    outside pyplot, so they are only available as saved files, not live
+    windows. The batch entry points run under _BATCH_RC_PARAMS via
+    @_batch_rendering; apply_theme no longer changes the global rcParams
+    for those settings.
+    """
     
-    def __init__(self, config: Optional[PlotConfig] = None, theme: Optional[PlotTheme] = None):
+    def __init__(self, config: Optional[PlotConfig] = None, theme: Optional[PlotTheme] = None,
+                 reuse_figure: bool = False):
         self.config = config or PlotConfig()
         self.theme = theme or PUBLICATION_THEME
         self.config.apply_theme(self.theme)
+        # Keep one figure alive across plot calls (cleared in between) to skip
+        # figure/axes construction when plotting many genes; call close() when done
+        self.reuse_figure = reuse_figure
+        self._fig = None
+        self._ax = None
+    
+    def _get_figure(self, figsize: Tuple[int, int], ncols: int = 1):
+        """Return a 1 x ncols figure, reusing the previous one when reuse_figure is set.
+
+        The axes are returned as plt.subplots would: a single Axes for one
+        column, otherwise an array of Axes.
+        """
+        if not self.reuse_figure:
+            return self._new_figure(figsize, ncols)
+        
+        if (self._fig is not None
+                and tuple(self._fig.get_size_inches()) == tuple(figsize)
+                and len(self._fig.axes) == ncols):
+            for ax in self._fig.axes:
+                ax.cla()
+        else:
+            self.close()
+            self._fig, self._ax = self._new_figure(figsize, ncols)
+        return self._fig, self._ax
     
-    def _save_figure(self, fig: plt.Figure, output_path: Path, close_fig: bool = True) -> None:
-        """Save figure with proper formatting and cleanup."""
+    @staticmethod
+    def _new_figure(figsize: Tuple[int, int], ncols: int):
+        """Create a figure on its own Agg canvas, bypassing pyplot.
+
+        The figure is never registered with pyplot's figure manager, so it needs
+        no plt.close() and is freed once the last reference goes away.
+        """
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots(1, ncols)
+    
+    def close(self) -> None:
+        """Release the figure kept for reuse, if any."""
+        self._fig = None
+        self._ax = None
+    
+    def _save_figure(self, fig: plt.Figure, output_path: Path) -> None:
+        """Save figure with proper formatting.
+
+        Plotter figures live outside pyplot (see _new_figure), so there is no
+        figure manager to close afterwards.
+        """
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # PNG encoding (zlib) dominates save time at publication DPI
+        extra = {}
+        if self.config.output_format == 'png':
+            extra['pil_kwargs'] = {'compress_level': self.config.png_compress_level}
+        
         fig.savefig(
             output_path,
             format=self.config.output_format,
             dpi=self.config.output_dpi,
             bbox_inches=self.config.bbox_inches,
             facecolor='white',
-            edgecolor='none'
+            edgecolor='none',
+            **extra
         )
         
         print(f"Saved scientific plot to {output_path}")
-        
-        if close_fig:
-            plt.close(fig)
+    
+    def _should_rasterize(self, n_points: int) -> bool:
+        """Whether data artists of this size should be rasterized in vector output.
+
+        Below the threshold the vector paths are smaller than a full-DPI raster.
+        """
+        return n_points > self.config.rasterize_min_points
     
 
 
 class ConservationPlotter(BasePlotter):
     """Publication-quality conservation analysis plots with statistical rigor."""
     
+    @_batch_rendering
     def plot_conservation_with_confidence(self, csv_file: Path, 
                                         output_dir: Optional[Path] = None) -> Path:
         """
@@ -58,38 +550,138 @@ class ConservationPlotter(BasePlotter):
         Returns:
             Path to saved plot
         """
-        df = pd.read_csv(csv_file)
-        
         if output_dir is None:
             output_dir = csv_file.parent
         
-        fig, ax1 = plt.subplots(1, 1, figsize=self.config.figsize_conservation)
-        
-        # Main conservation plot
-        self._plot_conservation_main(ax1, df, csv_file.stem)
-        
-        plt.tight_layout()
+        fig = self._draw_conservation(csv_file)
         
         output_path = output_dir / f"{csv_file.stem}_scientific.{self.config.output_format}"
         self._save_figure(fig, output_path)
         
         return output_path
     
-    def _plot_conservation_main(self, ax: plt.Axes, df: pd.DataFrame, title_base: str) -> None:
-        """Plot main conservation curves with confidence intervals."""
-        positions = df['Position'].values
-        entropy_gaps = df['ShannonEntropy_WithGaps'].values
-        entropy_nogaps = df['ShannonEntropy_NoGaps'].values
+    def _draw_conservation(self, csv_file: Path) -> Figure:
+        """Load one conservation CSV and draw it onto a laid-out figure."""
+        mtime_ns = csv_file.stat().st_mtime_ns
+        df = _load_conservation(str(csv_file), mtime_ns)
+        arrays = _load_conservation_arrays(str(csv_file), mtime_ns)
+        
+        fig, ax1 = self._get_figure(self.config.figsize_conservation)
+        
+        # Main conservation plot
+        self._plot_conservation_main(ax1, df, arrays, csv_file.stem)
+        
+        fig.tight_layout()
+        return fig
+    
+    @_batch_rendering
+    def plot_many(self, csv_files: List[Path], output_dir: Optional[Path] = None) -> List[Path]:
+        """
+        Plot several conservation CSVs on one reused figure.
+        
+        The figure and axes are built once and cleared between files (as with
+        reuse_figure=True); a figure this call created is released afterwards.
+        
+        Args:
+            csv_files: Paths to conservation CSV files
+            output_dir: Output directory for plots (defaults to each CSV's directory)
+            
+        Returns:
+            Paths to saved plots, in input order
+        """
+        reuse_figure = self.reuse_figure
+        self.reuse_figure = True
+        try:
+            return [self.plot_conservation_with_confidence(csv_file, output_dir)
+                    for csv_file in csv_files]
+        finally:
+            self.reuse_figure = reuse_figure
+            if not reuse_figure:
+                self.close()
+    
+    @_batch_rendering
+    def plot_many_to_pdf(self, csv_files: List[Path], output_path: Path) -> Path:
+        """
+        Plot several conservation CSVs as the pages of one multi-page PDF.
+        
+        Fonts and other shared resources are embedded once for the whole
+        document instead of once per file; the figure is reused as in plot_many.
+        
+        Args:
+            csv_files: Paths to conservation CSV files, one page each
+            output_path: Path of the PDF to write
+            
+        Returns:
+            Path to the saved PDF
+        """
+        from matplotlib.backends.backend_pdf import PdfPages
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        reuse_figure = self.reuse_figure
+        self.reuse_figure = True
+        try:
+            with PdfPages(output_path) as pdf:
+                for csv_file in csv_files:
+                    pdf.savefig(self._draw_conservation(csv_file),
+                                dpi=self.config.output_dpi,
+                                bbox_inches=self.config.bbox_inches,
+                                facecolor='white', edgecolor='none')
+        finally:
+            self.reuse_figure = reuse_figure
+            if not reuse_figure:
+                self.close()
+        
+        print(f"Saved scientific plot to {output_path}")
+        return output_path
+    
+    def _plot_conservation_main(self, ax: plt.Axes, df: pd.DataFrame,
+                                arrays: _ConservationArrays, title_base: str) -> None:
+        """Plot main conservation curves with confidence intervals.
+
+        Curves are drawn from the float32 arrays; legend statistics are computed
+        separately on the float64 DataFrame.
+        """
+        from scipy.signal import savgol_filter
+
+        positions = arrays.positions
+        entropy_gaps = arrays.entropy_gaps
+        entropy_nogaps = arrays.entropy_nogaps
+
+        # Downsample to the rendered pixel width - sub-pixel detail is never drawn
+        render_width_px = int(self.config.figsize_conservation[0] * self.config.output_dpi)
+        stride = max(1, positions.size // (2 * render_width_px))
+        if stride > 1:
+            positions = positions[::stride]
+            entropy_gaps = entropy_gaps[::stride]
+            entropy_nogaps = entropy_nogaps[::stride]
+
+        # Strided slices are views; hand contiguous buffers to scipy/matplotlib
+        # so they don't copy internally (no-op when already contiguous)
+        positions = np.ascontiguousarray(positions)
+        entropy_gaps = np.ascontiguousarray(entropy_gaps)
+        entropy_nogaps = np.ascontiguousarray(entropy_nogaps)
+
         # Apply smoothing if requested
         if self.config.conservation_smoothing_window > 1:
             window = min(self.config.conservation_smoothing_window, len(positions) // 4)
             if window >= 3 and window % 2 == 0:  # savgol_filter requires odd window
                 window += 1
-            
+
+            # Short windows on sequences that fit the render width add no visible detail
+            if window < 5 and positions.size <= 2 * render_width_px:
+                window = 0
+
             if window >= 3:
-                entropy_gaps_smooth = savgol_filter(entropy_gaps, window, 2)
-                entropy_nogaps_smooth = savgol_filter(entropy_nogaps, window, 2)
+                stacked = np.stack([entropy_gaps, entropy_nogaps])
+                if self.config.conservation_smoothing_method == 'boxcar':
+                    # Plain moving average: no polynomial fit, no edge overshoot
+                    smoothed = _boxcar_smooth(stacked, window)
+                else:
+                    # One call over both series: coefficients are computed once and the
+                    # FIR pass runs over a stacked 2xN array (same interp edge fit per row)
+                    smoothed = savgol_filter(stacked, window, 2, axis=-1, mode='interp')
+                entropy_gaps_smooth, entropy_nogaps_smooth = smoothed
             else:
                 entropy_gaps_smooth = entropy_gaps
                 entropy_nogaps_smooth = entropy_nogaps
@@ -98,17 +690,20 @@ class ConservationPlotter(BasePlotter):
             entropy_nogaps_smooth = entropy_nogaps
         
         # Plot main lines
+        rasterize = self._should_rasterize(len(positions))
         line1 = ax.plot(positions, entropy_gaps_smooth, 
                        color=self.theme.primary_color, 
                        label='With Gaps', 
                        alpha=self.theme.alpha,
-                       linewidth=self.theme.line_width)[0]
+                       linewidth=self.theme.line_width,
+                       rasterized=rasterize)[0]
         
         line2 = ax.plot(positions, entropy_nogaps_smooth,
                        color=self.theme.secondary_color,
                        label='Without Gaps', 
                        alpha=self.theme.alpha,
-                       linewidth=self.theme.line_width)[0]
+                       linewidth=self.theme.line_width,
+                       rasterized=rasterize)[0]
         
         # Add confidence intervals if requested
         if self.config.show_confidence_intervals:
@@ -128,10 +723,9 @@ class ConservationPlotter(BasePlotter):
         self._add_conservation_legend(ax, df)
         
         # Add horizontal line at theoretical maximum entropy
-        max_entropy = np.log2(20)  # 20 amino acids
-        ax.axhline(y=max_entropy, color=self.theme.error_color, 
+        ax.axhline(y=_MAX_ENTROPY_AA, color=self.theme.error_color, 
                   linestyle='--', alpha=0.5, linewidth=1,
-                  label=f'Max Entropy ({max_entropy:.1f} bits)')
+                  label=f'Max Entropy ({_MAX_ENTROPY_AA:.1f} bits)')
     
     def _add_confidence_intervals(self, ax: plt.Axes, positions: np.ndarray,
                                 entropy_gaps: np.ndarray, entropy_nogaps: np.ndarray) -> None:
@@ -139,41 +733,45 @@ class ConservationPlotter(BasePlotter):
         # Calculate rolling standard error as proxy for confidence interval
         window = max(5, len(positions) // 50)
         
-        def rolling_std_error(data, window):
-            return pd.Series(data).rolling(window, center=True, min_periods=1).std() / np.sqrt(window)
-        
-        gaps_se = rolling_std_error(entropy_gaps, window)
-        nogaps_se = rolling_std_error(entropy_nogaps, window)
+        # Band half-width = z * SE = z * std / sqrt(window); fold both scalars into
+        # one in-place multiply on the freshly allocated std arrays
+        scale = _z_score(self.config.confidence_level) / np.sqrt(window)
+        gaps_half = _rolling_std_centered(np.asarray(entropy_gaps, dtype=np.float64), window)
+        gaps_half *= scale
+        nogaps_half = _rolling_std_centered(np.asarray(entropy_nogaps, dtype=np.float64), window)
+        nogaps_half *= scale
         
-        # Z-score for confidence level
-        z_score = stats.norm.ppf(1 - (1 - self.config.confidence_level) / 2)
-        
-        # Plot confidence intervals
+        # Plot confidence intervals (rasterized with the curves for large vector outputs)
+        rasterize = self._should_rasterize(len(positions))
         ax.fill_between(positions, 
-                       entropy_gaps - z_score * gaps_se,
-                       entropy_gaps + z_score * gaps_se,
+                       entropy_gaps - gaps_half,
+                       entropy_gaps + gaps_half,
                        color=self.theme.primary_color, alpha=0.2, 
-                       label=f'{self.config.confidence_level*100:.0f}% CI (With Gaps)')
+                       label=f'{self.config.confidence_level*100:.0f}% CI (With Gaps)',
+                       rasterized=rasterize)
         
         ax.fill_between(positions,
-                       entropy_nogaps - z_score * nogaps_se, 
-                       entropy_nogaps + z_score * nogaps_se,
+                       entropy_nogaps - nogaps_half, 
+                       entropy_nogaps + nogaps_half,
                        color=self.theme.secondary_color, alpha=0.2,
-                       label=f'{self.config.confidence_level*100:.0f}% CI (Without Gaps)')
+                       label=f'{self.config.confidence_level*100:.0f}% CI (Without Gaps)',
+                       rasterized=rasterize)
     
     def _add_conservation_legend(self, ax: plt.Axes, df: pd.DataFrame) -> None:
         """Add scientific legend with key statistics and data summary."""
-        # Calculate comprehensive statistics
-        gaps_mean = df['ShannonEntropy_WithGaps'].mean()
-        nogaps_mean = df['ShannonEntropy_NoGaps'].mean()
-        gaps_std = df['ShannonEntropy_WithGaps'].std()
-        nogaps_std = df['ShannonEntropy_NoGaps'].std()
-        
-        # Conservation thresholds based on Shannon entropy
-        highly_conserved = (df['ShannonEntropy_NoGaps'] < 0.5).sum()
-        moderately_conserved = ((df['ShannonEntropy_NoGaps'] >= 0.5) & 
-                               (df['ShannonEntropy_NoGaps'] < 1.5)).sum()
-        variable_regions = (df['ShannonEntropy_NoGaps'] >= 1.5).sum()
+        # Calculate comprehensive statistics over one (2, N) array; nan-aware with
+        # ddof=1 to match the pandas mean/std reductions this replaces
+        entropy = np.asarray(df[['ShannonEntropy_WithGaps', 'ShannonEntropy_NoGaps']],
+                             dtype=np.float64).T
+        gaps_mean, nogaps_mean = np.nanmean(entropy, axis=1)
+        gaps_std, nogaps_std = np.nanstd(entropy, axis=1, ddof=1)
+
+        # Conservation thresholds based on Shannon entropy:
+        # bin 0 = highly conserved (< 0.5), 1 = moderate (0.5-1.5), 2 = variable (>= 1.5).
+        # NaN fails every comparison, so it belongs to no bin (digitize would put it in 2)
+        nogaps = entropy[1]
+        bins = np.digitize(nogaps[~np.isnan(nogaps)], [0.5, 1.5])
+        highly_conserved, moderately_conserved, variable_regions = np.bincount(bins, minlength=3)[:3]
         total_positions = len(df)
         
         # Create comprehensive legend with percentages
@@ -197,6 +795,7 @@ class ConservationPlotter(BasePlotter):
 class PhylogeneticPlotter(BasePlotter):
     """Publication-quality phylogenetic tree visualization."""
     
+    @_batch_rendering
     def plot_tree_scientific(self, tree_file: Path, 
                             output_dir: Optional[Path] = None) -> Path:
         """
@@ -209,21 +808,19 @@ class PhylogeneticPlotter(BasePlotter):
         Returns:
             Path to saved plot
         """
+        from Bio import Phylo
+
         if output_dir is None:
             output_dir = tree_file.parent
             
         tree = Phylo.read(tree_file, 'newick')
         
-        fig, ax = plt.subplots(figsize=self.config.figsize_phylogeny)
+        fig, ax = self._get_figure(self.config.figsize_phylogeny)
         
         # Set up the tree plot with species labels
-        if self.config.tree_layout == 'circular':
-            Phylo.draw(tree, axes=ax, do_show=False, show_confidence=False,
-                      branch_labels=None if not self.config.show_branch_lengths else lambda x: f'{x.branch_length:.3f}',
-                      label_func=self._format_species_name)
-        else:
-            Phylo.draw(tree, axes=ax, do_show=False, show_confidence=False,
-                      label_func=self._format_species_name)
+        show_branch_lengths = (self.config.tree_layout == 'circular'
+                               and self.config.show_branch_lengths)
+        self._draw_tree(ax, tree, show_branch_lengths)
         
         # Enhance the plot
         self._enhance_tree_plot(ax, tree, tree_file.stem)
@@ -233,53 +830,83 @@ class PhylogeneticPlotter(BasePlotter):
         
         return output_path
     
+    def _draw_tree(self, ax: plt.Axes, tree, show_branch_lengths: bool = False) -> None:
+        """Draw a rectangular tree as one LineCollection plus tip/branch labels.
+
+        Uses the same layout as ``Phylo.draw`` (x = depth from root, tips at
+        integer rows, inner clades midway between first and last child) but
+        collects every branch into a single segment array instead of creating
+        one collection per line.
+        """
+        # Single iterative pre-order walk (left to right, no recursion limit)
+        # collecting depths by branch length and by branch count, as
+        # tree.depths() would, plus each clade's parent
+        root = tree.root
+        preorder = []
+        parents = {}
+        depths = {root: root.branch_length or 0}
+        unit_depths = {root: root.branch_length or 0}
+        stack = [root]
+        while stack:
+            clade = stack.pop()
+            preorder.append(clade)
+            for child in reversed(clade.clades):
+                parents[child] = clade
+                depths[child] = depths[clade] + (child.branch_length or 0)
+                unit_depths[child] = unit_depths[clade] + 1
+                stack.append(child)
+        if not max(depths.values()):
+            depths = unit_depths
+
+        terminals = [clade for clade in preorder if not clade.clades]
+        heights = {tip: float(i) for i, tip in enumerate(terminals, start=1)}
+
+        # Reversed pre-order visits children before parents: inner clade rows
+        for clade in reversed(preorder):
+            if clade.clades:
+                heights[clade] = (heights[clade.clades[0]] + heights[clade.clades[-1]]) / 2.0
+
+        # One horizontal segment per clade plus one vertical per inner clade
+        n_inner = len(preorder) - len(terminals)
+        segments = np.empty((len(preorder) + n_inner, 2, 2))
+        i = 0
+        for clade in preorder:
+            x_start = depths[parents[clade]] if clade is not root else 0.0
+            x_here = depths[clade]
+            y_here = heights[clade]
+            segments[i] = ((x_start, y_here), (x_here, y_here))
+            i += 1
+
+            label = self._format_species_name(clade)
+            if label:
+                ax.text(x_here, y_here, f" {label}", verticalalignment='center')
+            if show_branch_lengths and clade.branch_length is not None:
+                ax.text(0.5 * (x_start + x_here), y_here, f'{clade.branch_length:.3f}',
+                        fontsize='small', horizontalalignment='center')
+
+            if clade.clades:
+                segments[i] = ((x_here, heights[clade.clades[-1]]),
+                               (x_here, heights[clade.clades[0]]))
+                i += 1
+
+        ax.add_collection(LineCollection(segments, colors='k', linewidths=self.theme.line_width,
+                                         capstyle='round', joinstyle='round'))
+
+        if tree.name:
+            ax.set_title(tree.name)
+        ax.set_xlabel('branch length')
+        ax.set_ylabel('taxa')
+        xmax = max(depths.values())
+        ax.set_xlim(-0.05 * xmax, 1.25 * xmax)
+        ax.set_ylim(len(terminals) + 0.8, 0.2)
+
     def _format_species_name(self, clade):
         """Format species names for display on tree with common names and protein IDs."""
         if not clade.name:
             return ""
         
-        # Load species mapping from genes_to_proteins.json
-        from ..config import path_config
-        from ..util import file_util
-        
-        genes_to_proteins = file_util.open_file_return_as_json(
-            f"{path_config.DATA_INPUT_DIR}/genes_to_proteins.json"
-        )
-        
-        # Build dynamic mapping from protein IDs to species info
-        name_map = {}
-        for gene_name, orthologs in genes_to_proteins.items():
-            for ortholog in orthologs:
-                species_full = ortholog["species"]
-                # Convert "Homo sapiens" to "H. sapiens"
-                parts = species_full.split()
-                species_abbrev = f"{parts[0][0]}. {parts[1]}" if len(parts) >= 2 else species_full
-                
-                # Add common names mapping
-                common_names = {
-                    "H. sapiens": "Human",
-                    "M. musculus": "Mouse", 
-                    "M. mulatta": "Macaque",
-                    "G. gallus": "Chicken",
-                    "P. major": "Great Tit"
-                }
-                
-                common_name = common_names.get(species_abbrev, species_abbrev)
-                
-                if ortholog.get("uniprot_id"):
-                    name_map[ortholog["uniprot_id"]] = {
-                        "species": species_abbrev,
-                        "common": common_name,
-                        "protein_id": ortholog["uniprot_id"]
-                    }
-                if ortholog.get("entrez_protein_id"):
-                    name_map[ortholog["entrez_protein_id"]] = {
-                        "species": species_abbrev,
-                        "common": common_name,
-                        "protein_id": ortholog["entrez_protein_id"]
-                    }
-        
         # Extract species identifier and protein ID from full name
+        name_map = _load_species_name_map()
         for key, info in name_map.items():
             if key in clade.name:
                 return f"{info['common']} ({info['species']})\n{info['protein_id']}"
@@ -307,6 +934,7 @@ class PhylogeneticPlotter(BasePlotter):
 class VariantPlotter(BasePlotter):
     """Scientific variant analysis visualization with statistical testing."""
     
+    @_batch_rendering
     def plot_variants_with_statistics(self, conservation_csv: Path, variants_csv: Path,
                                     output_dir: Optional[Path] = None) -> Path:
         """
@@ -320,7 +948,9 @@ class VariantPlotter(BasePlotter):
         Returns:
             Path to saved plot
         """
-        consv_df = pd.read_csv(conservation_csv)
+        mtime_ns = conservation_csv.stat().st_mtime_ns
+        consv_df = _load_conservation(str(conservation_csv), mtime_ns)
+        consv_arrays = _load_conservation_arrays(str(conservation_csv), mtime_ns)
         vars_df = pd.read_csv(variants_csv)
         
         if output_dir is None:
@@ -333,13 +963,13 @@ class VariantPlotter(BasePlotter):
         stats_results = self._analyze_variant_conservation(consv_df, vars_df)
         
         # Create plot (single panel)
-        fig, ax = plt.subplots(1, 1, figsize=self.config.figsize_variants)
+        fig, ax = self._get_figure(self.config.figsize_variants)
         
         # Main variant overlay plot
-        self._plot_variant_overlay_main(ax, consv_df, vars_df, stats_results,
+        self._plot_variant_overlay_main(ax, consv_df, consv_arrays, vars_df, stats_results,
                                        conservation_csv.stem)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         output_path = output_dir / f"{conservation_csv.stem}_variants_scientific.{self.config.output_format}"
         self._save_figure(fig, output_path)
@@ -347,44 +977,70 @@ class VariantPlotter(BasePlotter):
         return output_path
     
     def _parse_variant_positions(self, vars_df: pd.DataFrame) -> pd.DataFrame:
-        """Parse variant positions from different formats."""
-        def parse_position(x):
-            try:
-                if pd.isna(x):
-                    return None
-                if isinstance(x, str) and '{' in x:
-                    return int(eval(x)['value'])
-                return int(float(x))
-            except (ValueError, TypeError, SyntaxError):
-                return None
-        
-        vars_df = vars_df.copy()
-        vars_df['parsed_position'] = vars_df['position'].apply(parse_position)
-        vars_df = vars_df.dropna(subset=['parsed_position'])
-        vars_df['parsed_position'] = vars_df['parsed_position'].astype(int)
-        
-        return vars_df
+        """Parse variant positions from different formats.
+        
+        Handles plain numbers and UniProt location dicts serialized as strings
+        (e.g. "{'value': 123, 'modifier': 'EXACT'}"); unparseable rows are dropped.
+        """
+        parsed = parse_position_values(vars_df['position'])
+        valid = parsed.notna()
+        if not valid.all():
+            vars_df, parsed = vars_df[valid], parsed[valid]
+        
+        # assign adds the column to a new frame that shares the existing columns
+        # (copy-on-write) instead of deep-copying the whole variants table first
+        return vars_df.assign(parsed_position=parsed.astype(int))
+    
+    @staticmethod
+    def _entropy_by_position(consv_df: pd.DataFrame) -> pd.Series:
+        """Map Position -> ShannonEntropy_NoGaps (first row wins for duplicate positions).
+
+        Frames from _load_conservation are already Position-indexed; their cached
+        index (and its hash table) is reused instead of building a new one per plot.
+        """
+        if consv_df.index.name == 'Position':
+            entropy_by_pos = consv_df['ShannonEntropy_NoGaps']
+        else:
+            entropy_by_pos = pd.Series(consv_df['ShannonEntropy_NoGaps'].to_numpy(),
+                                       index=consv_df['Position'].to_numpy())
+        if not entropy_by_pos.index.is_unique:
+            entropy_by_pos = entropy_by_pos[~entropy_by_pos.index.duplicated(keep='first')]
+        return entropy_by_pos
     
     def _analyze_variant_conservation(self, consv_df: pd.DataFrame, 
                                     vars_df: pd.DataFrame) -> Dict[str, Any]:
         """Perform statistical analysis of variant-conservation relationship."""
+        from scipy import stats
+
         # Get conservation scores at variant positions
-        variant_positions = vars_df['parsed_position'].values
-        valid_positions = np.isin(variant_positions, consv_df['Position'].values)
+        variant_positions = vars_df['parsed_position'].to_numpy()
+        consv_positions = consv_df['Position'].to_numpy()
+        consv_entropy = consv_df['ShannonEntropy_NoGaps'].to_numpy()
+        # Frames from _load_conservation are Position-indexed and sorted; the
+        # index caches its monotonic flag, so repeat analyses skip the O(N) check
+        positions_key = consv_df.index if consv_df.index.name == 'Position' else consv_df['Position']
+        if not positions_key.is_monotonic_increasing:
+            order = np.argsort(consv_positions, kind='stable')
+            consv_positions, consv_entropy = consv_positions[order], consv_entropy[order]
+        n_positions = len(consv_positions)
+        if n_positions == 0:
+            return {'error': 'No matching positions found'}
+        
+        # Binary-search each variant in the sorted positions (leftmost hit = first row)
+        idx = np.minimum(np.searchsorted(consv_positions, variant_positions), n_positions - 1)
+        valid_positions = consv_positions[idx] == variant_positions
         
         if not np.any(valid_positions):
             return {'error': 'No matching positions found'}
         
-        variant_conservation = []
-        background_conservation = []
+        variant_conservation = consv_entropy[idx[valid_positions]]
         
-        for pos in variant_positions[valid_positions]:
-            conservation_score = consv_df[consv_df['Position'] == pos]['ShannonEntropy_NoGaps'].iloc[0]
-            variant_conservation.append(conservation_score)
-        
-        # Background is all non-variant positions
-        background_positions = ~np.isin(consv_df['Position'], variant_positions)
-        background_conservation = consv_df[background_positions]['ShannonEntropy_NoGaps'].values
+        # Background is all non-variant positions: mark each hit's run of rows
+        hits = np.unique(variant_positions[valid_positions])
+        run_delta = np.zeros(n_positions + 1, dtype=np.int64)
+        run_delta[np.searchsorted(consv_positions, hits, side='left')] += 1
+        run_delta[np.searchsorted(consv_positions, hits, side='right')] -= 1
+        background_conservation = consv_entropy[np.cumsum(run_delta[:-1]) == 0]
         
         # Statistical tests
         if len(variant_conservation) > 1 and len(background_conservation) > 1:
@@ -394,21 +1050,26 @@ class VariantPlotter(BasePlotter):
                                                    alternative='two-sided')
             
             # Effect size (Cohen's d)
-            pooled_std = np.sqrt(((len(variant_conservation) - 1) * np.var(variant_conservation, ddof=1) +
-                                (len(background_conservation) - 1) * np.var(background_conservation, ddof=1)) /
-                               (len(variant_conservation) + len(background_conservation) - 2))
+            n1, n2 = len(variant_conservation), len(background_conservation)
+            mean1, var1 = _mean_var(variant_conservation)
+            mean2, var2 = _mean_var(background_conservation)
+            pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
             
-            cohens_d = (np.mean(variant_conservation) - np.mean(background_conservation)) / pooled_std
+            cohens_d = (mean1 - mean2) / pooled_std
+            # Reported means come from the same single pass as the variances
+            variant_mean, background_mean = mean1, mean2
         else:
             statistic, p_value, cohens_d = np.nan, np.nan, np.nan
+            variant_mean = np.mean(variant_conservation) if len(variant_conservation) > 0 else np.nan
+            background_mean = np.mean(background_conservation)
         
         return {
-            'variant_conservation': np.array(variant_conservation),
+            'variant_conservation': variant_conservation,
             'background_conservation': background_conservation,
             'n_variants': len(variant_conservation),
             'n_background': len(background_conservation),
-            'variant_mean': np.mean(variant_conservation) if variant_conservation else np.nan,
-            'background_mean': np.mean(background_conservation),
+            'variant_mean': variant_mean,
+            'background_mean': background_mean,
             'mann_whitney_statistic': statistic,
             'p_value': p_value,
             'cohens_d': cohens_d,
@@ -416,32 +1077,51 @@ class VariantPlotter(BasePlotter):
         }
     
     def _plot_variant_overlay_main(self, ax: plt.Axes, consv_df: pd.DataFrame,
+                                  consv_arrays: _ConservationArrays,
                                   vars_df: pd.DataFrame, stats_results: Dict[str, Any],
                                   title_base: str) -> None:
-        """Plot main conservation curve with intelligent variant overlay."""
-        # Conservation curve with enhanced visibility
-        ax.plot(consv_df['Position'], consv_df['ShannonEntropy_NoGaps'],
+        """Plot main conservation curve with intelligent variant overlay.
+
+        The curve comes from the float32 consv_arrays; the variant statistics
+        and annotation lookups still read the float64 DataFrame.
+        """
+        consv_positions = consv_arrays.positions
+        consv_entropy = consv_arrays.entropy_nogaps
+
+        # Conservation curve with enhanced visibility. Very dense data artists are
+        # rasterized so PDF/SVG output stays small; text and axes remain vector
+        rasterize = self._should_rasterize(len(consv_positions) + len(vars_df))
+        ax.plot(consv_positions, consv_entropy,
                color=self.theme.primary_color, linewidth=self.theme.line_width,
-               alpha=self.theme.alpha, label='Conservation', zorder=1)
+               alpha=self.theme.alpha, label='Conservation', zorder=1, rasterized=rasterize)
         
         
         # Intelligent variant clustering and display
-        variant_positions = np.array(vars_df['parsed_position'].values)
-        
+        variant_positions = np.ascontiguousarray(vars_df['parsed_position'].to_numpy())
+
         # Dynamically classify variants from raw data descriptions - NO hardcoding!
         lof_positions, pathogenic_positions, additional_classifications = self._get_dynamic_variant_classifications(vars_df, title_base)
+        # Coerce once; both lists come back sorted and de-duplicated, which
+        # _sorted_membership relies on
+        lof_positions = np.asarray(lof_positions, dtype=np.int64)
+        pathogenic_positions = np.asarray(pathogenic_positions, dtype=np.int64)
+
+        # Position -> entropy lookup shared by the scatter branch and both annotation passes
+        entropy_by_position = self._entropy_by_position(consv_df)
         
         # Define y-axis limits for vertical lines
-        y_min = consv_df['ShannonEntropy_NoGaps'].min()
-        y_max = consv_df['ShannonEntropy_NoGaps'].max()
+        y_min = np.nanmin(consv_entropy)
+        y_max = np.nanmax(consv_entropy)
+        
+        # Pathogenic highlighting always uses the unclustered positions
+        pathogenic_mask = _sorted_membership(variant_positions, pathogenic_positions)
         
         # Cluster nearby variants if enabled
         if self.config.cluster_nearby_variants and len(variant_positions) > self.config.max_annotation_density:
             clustered_positions = self._cluster_variants(variant_positions)
             regular_positions, lof_variant_positions = self._separate_lof_variants(clustered_positions, lof_positions)
         else:
-            lof_mask = np.isin(variant_positions, lof_positions)
-            pathogenic_mask = np.isin(variant_positions, pathogenic_positions)
+            lof_mask = _sorted_membership(variant_positions, lof_positions)
             # Regular positions are those that are neither LOF nor pathogenic
             regular_mask = ~(lof_mask | pathogenic_mask)
             regular_positions = variant_positions[regular_mask]
@@ -451,11 +1131,10 @@ class VariantPlotter(BasePlotter):
         if len(regular_positions) > 0:
             if len(regular_positions) > self.config.max_annotation_density:
                 # Use scatter plot for high density
-                conservation_at_variants = [consv_df[consv_df['Position'] == pos]['ShannonEntropy_NoGaps'].iloc[0] 
-                                          for pos in regular_positions if pos in consv_df['Position'].values]
-                ax.scatter(regular_positions[:len(conservation_at_variants)], conservation_at_variants, 
+                conservation_at_variants = entropy_by_position.reindex(regular_positions).dropna()
+                ax.scatter(conservation_at_variants.index.to_numpy(), conservation_at_variants.to_numpy(), 
                           color=self.theme.accent_color, alpha=0.7, s=20, 
-                          label=f'Variants (n={len(regular_positions)})', zorder=3)
+                          label=f'Variants (n={len(regular_positions)})', zorder=3, rasterized=rasterize)
             else:
                 # Use vertical lines for lower density
                 variant_color = self.theme.accent_color
@@ -464,31 +1143,33 @@ class VariantPlotter(BasePlotter):
                 else:
                     variant_label = f'Variants (n={len(regular_positions)})'
                 
-                ax.vlines(regular_positions, y_min, y_max,
-                         colors=variant_color, alpha=self.config.variant_line_alpha,
-                         linewidth=self.config.variant_line_width, label=variant_label, zorder=2)
+                _vertical_lines(ax, regular_positions, y_min, y_max,
+                                   colors=variant_color, alpha=self.config.variant_line_alpha,
+                                   linewidth=self.config.variant_line_width, label=variant_label, zorder=2,
+                                   rasterized=rasterize)
         
         # Always highlight loss-of-function variants prominently (transparent to show conservation underneath)
         if len(lof_variant_positions) > 0:
-            ax.vlines(lof_variant_positions, y_min, y_max,
-                     colors='red', alpha=0.3, linewidth=6, 
-                     label=f'Loss-of-function (n={len(lof_variant_positions)})', zorder=4)
+            _vertical_lines(ax, lof_variant_positions, y_min, y_max,
+                               colors='red', alpha=0.3, linewidth=6, 
+                               label=f'Loss-of-function (n={len(lof_variant_positions)})', zorder=4,
+                               rasterized=rasterize)
             
             # Add LoF variant annotations with smart positioning to avoid overlap
             if len(lof_variant_positions) <= 10:
-                self._add_smart_annotations(ax, consv_df, lof_variant_positions, 'red', 'LOF')
+                self._add_smart_annotations(ax, entropy_by_position, lof_variant_positions, 'red', 'LOF')
         
         # Highlight pathogenic variants with distinct visual markers
-        pathogenic_mask = np.isin(variant_positions, pathogenic_positions)
         pathogenic_variant_positions = variant_positions[pathogenic_mask]
         if len(pathogenic_variant_positions) > 0:
-            ax.vlines(pathogenic_variant_positions, y_min, y_max,
-                     colors='orange', alpha=0.4, linewidth=4, 
-                     label=f'Likely Pathogenic (n={len(pathogenic_variant_positions)})', zorder=3)
+            _vertical_lines(ax, pathogenic_variant_positions, y_min, y_max,
+                               colors='orange', alpha=0.4, linewidth=4, 
+                               label=f'Likely Pathogenic (n={len(pathogenic_variant_positions)})', zorder=3,
+                               rasterized=rasterize)
             
             # Add likely pathogenic variant annotations with smart positioning to avoid overlap
             if len(pathogenic_variant_positions) <= 15:
-                self._add_smart_annotations(ax, consv_df, pathogenic_variant_positions, 'orange', 'LP')
+                self._add_smart_annotations(ax, entropy_by_position, pathogenic_variant_positions, 'orange', 'LP')
         
         # Enhanced formatting
         ax.set_xlabel('Protein Position', fontsize=self.theme.label_fontsize)
@@ -507,28 +1188,22 @@ class VariantPlotter(BasePlotter):
             return positions
         
         sorted_positions = np.sort(positions)
-        clustered = []
-        
-        i = 0
-        while i < len(sorted_positions):
-            cluster_start = sorted_positions[i]
-            cluster_positions = [cluster_start]
-            
-            # Find all positions within cluster distance
-            j = i + 1
-            while j < len(sorted_positions) and sorted_positions[j] - cluster_start <= self.config.cluster_distance:
-                cluster_positions.append(sorted_positions[j])
-                j += 1
-            
-            # Use median position to represent cluster
-            clustered.append(int(np.median(cluster_positions)))
-            i = j
-        
-        return np.array(clustered)
+        # A cluster spans everything within cluster_distance of its first position,
+        # so the end of a cluster starting at any index is a single searchsorted
+        cluster_ends = np.searchsorted(sorted_positions,
+                                       sorted_positions + self.config.cluster_distance,
+                                       side='right')
+        
+        starts = _cluster_starts(cluster_ends)
+        ends = cluster_ends[starts]
+        
+        # Use median position to represent cluster; slices are sorted, so the median
+        # is the middle element (or the floor of the two middle elements' mean)
+        return (sorted_positions[(starts + ends - 1) // 2] + sorted_positions[(starts + ends) // 2]) // 2
     
-    def _separate_lof_variants(self, positions: np.ndarray, lof_positions: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    def _separate_lof_variants(self, positions: np.ndarray, lof_positions: Union[List[int], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
         """Separate loss-of-function variants from regular variants."""
-        lof_mask = np.isin(positions, lof_positions)
+        lof_mask = _sorted_membership(positions, np.unique(lof_positions))
         regular_positions = positions[~lof_mask]
         lof_variant_positions = positions[lof_mask]
         return regular_positions, lof_variant_positions
@@ -546,81 +1221,77 @@ class VariantPlotter(BasePlotter):
         
         # Extract ALL variant classifications DYNAMICALLY from raw description data
         if 'description' in vars_df.columns:
-            for _, row in vars_df.iterrows():
-                pos = row['parsed_position']
-                desc = str(row.get('description', '')).lower()
-                
-                # Comprehensive variant classification based on actual data descriptions
-                
-                # Likely pathogenic variants (strict matching for scientific accuracy)
-                if 'likely pathogenic' in desc:
-                    pathogenic_positions.append(pos)
-                
-                # Likely benign variants
-                if 'likely benign' in desc:
-                    additional_classifications['benign'].append(pos)
-                
-                # Uncertain significance
-                if 'uncertain significance' in desc:
-                    additional_classifications['uncertain'].append(pos)
-                
-                # Borderline phenotype
-                if 'borderline' in desc:
-                    additional_classifications['borderline'].append(pos)
-                
-                # Reduced function (non-LOF but impaired)
-                if any(term in desc for term in ['reduced function', 'decreased peak current', 'impaired channel', 'reduced current']):
-                    additional_classifications['reduced_function'].append(pos)
-                
-                # Comprehensive LOF detection based on actual data patterns
-                lof_indicators = [
-                    'loss of function',
-                    'loss-of-function',
-                    'non-functional channel',
-                    'results in a non-functional channel',
-                    'complete absence of sodium current',
-                    'absence of sodium current', 
-                    'complete loss of sodium ion transmembrane transport',
-                    'complete loss of sodium'
-                ]
-                
-                if any(indicator in desc for indicator in lof_indicators):
-                    lof_positions.append(pos)
+            desc = vars_df['description'].astype(str).str.lower()
+            positions = vars_df['parsed_position']
+            
+            def positions_matching(pattern, regex=False):
+                return positions[desc.str.contains(pattern, regex=regex, na=False)].tolist()
+            
+            # Comprehensive variant classification based on actual data descriptions
+            
+            # Likely pathogenic variants (strict matching for scientific accuracy)
+            pathogenic_positions = positions_matching('likely pathogenic')
+            
+            # Likely benign variants
+            additional_classifications['benign'] = positions_matching('likely benign')
+            
+            # Uncertain significance
+            additional_classifications['uncertain'] = positions_matching('uncertain significance')
+            
+            # Borderline phenotype
+            additional_classifications['borderline'] = positions_matching('borderline')
+            
+            # Reduced function (non-LOF but impaired)
+            additional_classifications['reduced_function'] = positions_matching(_REDUCED_FUNCTION_RE, regex=True)
+            
+            # Comprehensive LOF detection based on actual data patterns
+            lof_positions = positions_matching(_LOF_RE, regex=True)
         
         # NO HARDCODING! All classifications must come from raw data descriptions.
         # This ensures the pipeline scales to any gene and accurately reflects the actual data.
         
         return sorted(list(set(lof_positions))), sorted(list(set(pathogenic_positions))), additional_classifications
     
-    def _add_smart_annotations(self, ax: plt.Axes, consv_df: pd.DataFrame, 
+    def _add_smart_annotations(self, ax: plt.Axes, entropy_by_position: pd.Series, 
                              positions: np.ndarray, color: str, annotation_type: str) -> None:
-        """Add annotations with smart positioning to avoid overlap."""
+        """Add annotations with smart positioning to avoid overlap.
+        
+        entropy_by_position is the Position -> entropy Series from _entropy_by_position.
+        """
         if len(positions) == 0:
             return
         
         # Sort positions for consistent annotation placement
         sorted_positions = np.sort(positions)
         
+        # Look scores up first so positions outside the conservation data cost
+        # nothing further when none of them can be annotated. Unscored positions
+        # are skipped but still count towards their group's size and member
+        # indices, so offsets alternate as before
+        score_idx = entropy_by_position.index.get_indexer(sorted_positions)
+        keep = score_idx >= 0
+        if not keep.any():
+            return
+        annotated_positions = sorted_positions[keep]
+        conservation_scores = entropy_by_position.to_numpy(dtype=float)[score_idx[keep]]
+        
+        # Snapshot plot boundaries once (each get_*lim call re-evaluates autoscaling)
+        x_min_plot, x_max_plot = ax.get_xlim()
+        y_min_plot, y_max_plot = ax.get_ylim()
+        x_range = x_max_plot - x_min_plot
+        y_range = y_max_plot - y_min_plot
+        
         # Calculate minimum distance for overlap detection (in data coordinates)
-        x_range = ax.get_xlim()[1] - ax.get_xlim()[0]
         # Use smaller threshold for tighter grouping - positions within 30 units are considered overlapping
         min_distance = min(30, x_range * 0.02)  # 30 positions or 2% of x-range, whichever is smaller
         
-        # Group positions that are close together
-        position_groups = []
-        current_group = [sorted_positions[0]]
-        
-        for pos in sorted_positions[1:]:
-            if pos - current_group[-1] < min_distance:
-                current_group.append(pos)
-            else:
-                position_groups.append(current_group)
-                current_group = [pos]
-        position_groups.append(current_group)
-        
-        # Get plot boundaries to avoid overlapping with axis labels
-        y_range = ax.get_ylim()[1] - ax.get_ylim()[0]
-        y_min_plot, y_max_plot = ax.get_ylim()
+        # Group positions that are close together (a gap of min_distance or more starts a
+        # new group); each position gets its group number, group size and index within it
+        group_starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_positions) >= min_distance) + 1))
+        group_sizes = np.diff(np.append(group_starts, sorted_positions.size))
+        group_of = np.repeat(np.arange(group_starts.size), group_sizes)
+        size_of = group_sizes[group_of]
+        index_in_group = np.arange(sorted_positions.size) - group_starts[group_of]
         
         # Define safe vertical offsets that stay within plot area
         # Positive offsets: stay below top 15% of plot area
@@ -636,54 +1307,65 @@ class VariantPlotter(BasePlotter):
         x_offsets_data = [0, x_range * 0.01, -x_range * 0.01, x_range * 0.015, -x_range * 0.015, 
                          x_range * 0.02, -x_range * 0.02, x_range * 0.008]
         
-        group_idx = 0
-        for group in position_groups:
-            for i, pos in enumerate(group):
-                if pos in consv_df['Position'].values:
-                    conservation_score = consv_df[consv_df['Position'] == pos]['ShannonEntropy_NoGaps'].iloc[0]
-                    
-                    # Use alternating offsets for overlapping positions
-                    offset_idx = (group_idx * len(group) + i) % len(y_offsets_data)
-                    y_offset_data_val = y_offsets_data[offset_idx]
-                    x_offset_data_val = x_offsets_data[offset_idx]
-                    
-                    # Calculate annotation position in data coordinates
-                    if y_offset_data_val > 0:
-                        # Positive offset: place above, but check if it fits
-                        annotation_y = min(conservation_score + y_offset_data_val, safe_top)
-                    else:
-                        # Negative offset: place below, but check if it fits
-                        annotation_y = max(conservation_score + y_offset_data_val, safe_bottom)
-                    
-                    # Calculate horizontal position with offset
-                    annotation_x = pos + x_offset_data_val
-                    
-                    # Adjust font size for crowded areas
-                    font_size = max(self.theme.tick_fontsize - 2, 6) if len(group) > 3 else self.theme.tick_fontsize - 1
-                    
-                    # Use abbreviated labels for crowded areas
-                    if len(group) > 2:
-                        label = f'{annotation_type}\n{pos}'
-                    else:
-                        label = f'{pos}'
-                    
-                    # Use data coordinates for annotation to keep it within safe area
-                    # Set high z-order to ensure annotations appear on top of all other elements
-                    ax.annotate(label, xy=(pos, conservation_score), 
-                               xytext=(annotation_x, annotation_y), textcoords='data',
-                               fontsize=font_size, 
-                               bbox=dict(boxstyle='round,pad=0.2', facecolor=color, alpha=0.9),
-                               color='white', weight='bold',
-                               ha='center', va='center', zorder=10,
-                               arrowprops=dict(arrowstyle='->', color=color, alpha=0.7, lw=1.5, zorder=9)
-                               if (abs(annotation_y - conservation_score) > y_range * 0.02 or 
-                                   abs(annotation_x - pos) > x_range * 0.005) else None)
-            group_idx += 1
+        y_offsets_data = np.array(y_offsets_data)
+        x_offsets_data = np.array(x_offsets_data)
+        
+        # Use alternating offsets for overlapping positions
+        offset_idx = ((group_of * size_of + index_in_group) % len(y_offsets_data))[keep]
+        y_offsets = y_offsets_data[offset_idx]
+        x_offsets = x_offsets_data[offset_idx]
+        
+        # Positive offset: place above, capped at safe_top;
+        # negative offset: place below, floored at safe_bottom
+        shifted_y = conservation_scores + y_offsets
+        annotation_ys = np.where(y_offsets > 0,
+                                 np.minimum(shifted_y, safe_top),
+                                 np.maximum(shifted_y, safe_bottom))
+        annotation_xs = annotated_positions + x_offsets
+        # Arrows are drawn when the label moved noticeably from its point
+        show_arrows = ((np.abs(annotation_ys - conservation_scores) > y_range * 0.02) |
+                       (np.abs(annotation_xs - annotated_positions) > x_range * 0.005))
+        
+        # Adjust font size for crowded areas
+        annotated_sizes = size_of[keep]
+        font_sizes = np.where(annotated_sizes > 3,
+                              max(self.theme.tick_fontsize - 2, 6), self.theme.tick_fontsize - 1)
+        
+        # Use abbreviated labels for crowded areas
+        labels = [f'{annotation_type}\n{pos}' if size > 2 else f'{pos}'
+                  for pos, size in zip(annotated_positions.tolist(), annotated_sizes.tolist())]
+        
+        # Constant styling shared by every annotation (matplotlib copies these dicts)
+        bbox_props = dict(boxstyle='round,pad=0.2', facecolor=color, alpha=0.9)
+        arrow_props = dict(arrowstyle='->', color=color, alpha=0.7, lw=1.5, zorder=9)
+        
+        # Use data coordinates for annotation to keep it within safe area
+        # Set high z-order to ensure annotations appear on top of all other elements
+        for label, pos, score, ann_x, ann_y, font_size, show_arrow in zip(
+                labels, annotated_positions, conservation_scores, annotation_xs, annotation_ys,
+                font_sizes.tolist(), show_arrows):
+            ax.annotate(label, xy=(pos, score), 
+                       xytext=(ann_x, ann_y), textcoords='data',
+                       fontsize=font_size, 
+                       bbox=bbox_props,
+                       color='white', weight='bold',
+                       ha='center', va='center', zorder=10,
+                       arrowprops=arrow_props if show_arrow else None)
 
 
 class ClinVarPlotter(BasePlotter):
     """ClinVar variant visualization with clean, pythonic implementation."""
     
+    def __init__(self, config: Optional[PlotConfig] = None, theme: Optional[PlotTheme] = None,
+                 reuse_figure: bool = False):
+        super().__init__(config, theme, reuse_figure)
+        # Bar colour per display class, resolved once instead of per bar
+        self._significance_colors = {
+            significance: self._get_variant_color(significance)
+            for significance in _ORDERED_CATEGORIES
+        }
+    
+    @_batch_rendering
     def plot_clinvar_variants(self, scn1a_csv: Path, depdc5_csv: Path, 
                              output_dir: Optional[Path] = None) -> Path:
         """
@@ -704,15 +1386,21 @@ class ClinVarPlotter(BasePlotter):
             gene_data = self._load_gene_data(scn1a_csv, depdc5_csv)
             output_dir = output_dir or scn1a_csv.parent
             
-            fig, axes = plt.subplots(1, len(gene_data), figsize=self.config.figsize_variants)
-            if len(gene_data) == 1:
+            # Count every gene before touching matplotlib, then draw
+            gene_counts = [(gene_name, self._count_clinical_significance(df), len(df))
+                           for gene_name, df in gene_data.items()]
+            
+            fig, axes = self._get_figure(self.config.figsize_variants, len(gene_counts))
+            if len(gene_counts) == 1:
                 axes = [axes]
             
-            for ax, (gene_name, df) in zip(axes, gene_data.items()):
-                self._plot_single_gene(ax, gene_name, df)
+            for ax, (gene_name, counts, total_count) in zip(axes, gene_counts):
+                self._plot_single_gene(ax, gene_name, counts, total_count)
             
             self._apply_common_styling(axes)
-            plt.tight_layout()
+            # One explicit layout pass: a layout engine would re-run on both of the
+            # draws savefig makes with bbox_inches='tight'
+            fig.tight_layout()
             
             output_path = output_dir / f"clinvar_variants_comparison.{self.config.output_format}"
             self._save_figure(fig, output_path)
@@ -730,7 +1418,7 @@ class ClinVarPlotter(BasePlotter):
         for csv_path in csv_paths:
             if csv_path.exists():
                 gene_name = self._extract_gene_name(csv_path.name)
-                gene_data[gene_name] = pd.read_csv(csv_path)
+                gene_data[gene_name] = _load_clinvar(str(csv_path), csv_path.stat().st_mtime_ns)
             else:
                 gene_name = self._extract_gene_name(csv_path.name)
                 gene_data[gene_name] = pd.DataFrame()
@@ -745,50 +1433,45 @@ class ClinVarPlotter(BasePlotter):
         if df.empty:
             return {}
         
-        counts = {}
-        for sig in df.get('clinical_significance', []):
-            sig_lower = str(sig).lower()
-            
-            # Use mapping to classify significance
-            classification = self._classify_significance(sig_lower)
-            counts[classification] = counts.get(classification, 0) + 1
+        if 'clinical_significance' not in df.columns:
+            return {}
+        
+        # Classify each distinct string once, then merge the per-string counts
+        codes, uniques = pd.factorize(df['clinical_significance'], use_na_sentinel=False)
+        per_unique = np.bincount(codes, minlength=len(uniques))
         
-        return counts
+        counts = Counter()
+        for sig, count in zip(uniques, per_unique.tolist()):
+            counts[self._classify_significance(str(sig).lower())] += count
+        
+        # Fixed category order so every gene's bars line up the same way
+        return {category: counts[category] for category in _ORDERED_CATEGORIES if counts[category] > 0}
     
     def _classify_significance(self, sig_lower: str) -> str:
         """Classify clinical significance using configuration mapping."""
-        # Check compound classifications first
-        if 'likely pathogenic' in sig_lower:
-            return CLINICAL_SIGNIFICANCE_MAPPING['likely_pathogenic']
-        if 'likely benign' in sig_lower:
-            return CLINICAL_SIGNIFICANCE_MAPPING['likely_benign']
-        
-        # Then check simple classifications
-        for key_pattern, display_name in CLINICAL_SIGNIFICANCE_MAPPING.items():
-            if key_pattern in sig_lower and key_pattern not in ['likely_pathogenic', 'likely_benign']:
-                return display_name
-        
-        return CLINICAL_SIGNIFICANCE_MAPPING['other']
+        return _classify_significance_cached(sig_lower)
     
-    def _plot_single_gene(self, ax: plt.Axes, gene_name: str, df: pd.DataFrame) -> None:
-        """Plot variants for a single gene."""
-        counts = self._count_clinical_significance(df)
+    def _plot_single_gene(self, ax: plt.Axes, gene_name: str, counts: Dict[str, int],
+                          total_count: int) -> None:
+        """Plot precomputed significance counts for a single gene."""
+        title_fontsize = self.theme.title_fontsize
         
         if not counts:
             ax.text(0.5, 0.5, 'No data available', 
                    transform=ax.transAxes, ha='center', va='center')
             ax.set_title(f'{gene_name} ClinVar Variants\nTotal: 0',
-                        fontsize=self.theme.title_fontsize, fontweight='bold')
+                        fontsize=title_fontsize, fontweight='bold')
             return
         
         # Create bars with configured colors
+        significance_colors = self._significance_colors
         bars = ax.bar(counts.keys(), counts.values(), 
-                     color=[self._get_variant_color(k) for k in counts.keys()])
+                     color=[significance_colors.get(k) or self._get_variant_color(k)
+                            for k in counts])
         
         # Set title and labels
-        total_count = len(df) if not df.empty else 0
         ax.set_title(f'{gene_name} ClinVar Variants\nTotal: {total_count}',
-                    fontsize=self.theme.title_fontsize, fontweight='bold')
+                    fontsize=title_fontsize, fontweight='bold')
         ax.set_ylabel('Count', fontsize=self.theme.label_fontsize)
         
         # Add count labels on bars
@@ -803,11 +1486,8 @@ class ClinVarPlotter(BasePlotter):
     
     def _add_bar_labels(self, ax: plt.Axes, bars) -> None:
         """Add count labels on top of bars."""
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2., 
-                   height + PLOT_POSITIONING['bar_label_offset'],
-                   f'{int(height)}', ha='center', va='bottom')
+        ax.bar_label(bars, labels=[f'{int(bar.get_height())}' for bar in bars],
+                     padding=PLOT_POSITIONING['bar_label_padding'])
     
     
     def _apply_common_styling(self, axes: List[plt.Axes]) -> None:
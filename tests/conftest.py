@@ -1,20 +1,18 @@
 import pytest
-import tempfile
-import shutil
+import numpy as np
+import pandas as pd
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Sequence
 from unittest.mock import AsyncMock
 
 @pytest.fixture
-def temp_data_dir():
-    """Create a temporary directory for test data."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+def temp_data_dir(tmp_path: Path) -> Path:
+    """Temporary directory for test data (pytest's per-test tmp_path)."""
+    return tmp_path
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_gene_config() -> Dict[str, Any]:
-    """Sample gene configuration for testing."""
+    """Sample gene configuration for testing (shared by the session; do not mutate)."""
     return {
         "SCN1A": [
             {
@@ -35,7 +33,7 @@ def mock_httpx_client():
     """Mock httpx async client."""
     return AsyncMock()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_fasta_content():
     """Sample FASTA content for testing."""
     return """>sp|P35498|SCN1A_HUMAN Sodium channel protein type 1 subunit alpha
@@ -43,11 +41,27 @@ MAASDSEYRTRSEAETLSITDMEAGTDVQKADGDFVQGQHQEVSKVQGTGTDSGAFQHGPQATP
 >sp|A2APX8|SCN1A_MOUSE Sodium channel protein type 1 subunit alpha  
 MAASDSEYRTRSEAETLSITDMEAGTDVQKADGDFVQGQHQEVSKVQGTGTDSGAFQHGPQATP"""
 
-@pytest.fixture 
+@pytest.fixture(scope="session")
 def sample_alignment_data():
-    """Sample alignment data for conservation analysis."""
+    """Sample alignment data for conservation analysis (shared by the session; do not mutate)."""
     return {
         "sequences": ["MAASD", "MAASD", "MAAAD"],
         "positions": list(range(5)),
         "species": ["Human", "Mouse", "Chicken"]
-    }
\ No newline at end of file
+    }
+
+@pytest.fixture
+def conservation_csv_files(tmp_path: Path) -> Callable[[Sequence[str], int], List[Path]]:
+    """Factory writing random {name}_conservation.csv files into tmp_path."""
+    def write(names: Sequence[str], n_positions: int) -> List[Path]:
+        csv_files = []
+        for name in names:
+            conservation_csv = tmp_path / f"{name}_conservation.csv"
+            pd.DataFrame({
+                'Position': range(1, n_positions + 1),
+                'ShannonEntropy_WithGaps': np.random.uniform(0, 2.5, n_positions),
+                'ShannonEntropy_NoGaps': np.random.uniform(0, 2.3, n_positions),
+            }).to_csv(conservation_csv, index=False)
+            csv_files.append(conservation_csv)
+        return csv_files
+    return write
@@ -3,10 +3,17 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 import tempfile
 from comparative_genomics_pipeline.service.biopython_service import (
-    visualize_and_save_trees
+    visualize_and_save_trees,
+    _run_plot_jobs
 )
 
 
+def _double_or_fail(value, output_dir):
+    if value < 0:
+        raise ValueError("negative input")
+    return value * 2
+
+
 class TestBiopythonServiceSimple:
     """Simplified tests for biopython service that actually work."""
 
@@ -44,4 +51,15 @@ class TestBiopythonServiceSimple:
         """Test that the module imports correctly."""
         from comparative_genomics_pipeline.service import biopython_service
         assert hasattr(biopython_service, 'visualize_and_save_trees')
-        assert hasattr(biopython_service, 'compute_conservation_scores')
\ No newline at end of file
+        assert hasattr(biopython_service, 'compute_conservation_scores')
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run_plot_jobs_collects_results_and_errors(self, workers):
+        """Test batch plot jobs keep input order and capture per-job failures."""
+        results = _run_plot_jobs(_double_or_fail, [(1, None), (-1, None), (3, None)], workers)
+        
+        assert [r[0] for r in results] == [1, -1, 3]
+        assert results[0][1] == 2 and results[0][2] is None
+        assert results[1][1] is None and isinstance(results[1][2], ValueError)
+        assert results[2][1] == 6
@@ -18,7 +18,15 @@ from comparative_genomics_pipeline.visualization.scientific_plots import (
     ConservationPlotter, 
     VariantPlotter, 
     PhylogeneticPlotter,
-    ClinVarPlotter
+    ClinVarPlotter,
+    _load_conservation,
+    _load_conservation_arrays,
+    _boxcar_smooth,
+    _cluster_starts_kernel,
+    _rolling_std_centered_kernel,
+    _rolling_std_centered_numpy,
+    _sorted_membership,
+    _vertical_lines,
 )
 from comparative_genomics_pipeline.service.biopython_service import (
     plot_variants_scientific,
@@ -77,7 +85,20 @@ class TestConservationVariantPlots:
         assert 'parsed_position' in parsed_df.columns
         assert len(parsed_df) == 5  # All positions should parse successfully
         assert list(parsed_df['parsed_position']) == [10, 25, 45, 60, 85]
-    
+
+    def test_variant_position_parsing_uniprot_location_format(self):
+        """Test UniProt location dicts are parsed and unparseable rows dropped."""
+        plotter = VariantPlotter()
+        variants = pd.DataFrame({
+            'position': ["{'value': 17, 'modifier': 'EXACT'}", '42', None, 'unknown', "{'modifier': 'UNKNOWN'}"],
+            'description': ['a', 'b', 'c', 'd', 'e']
+        })
+
+        parsed_df = plotter._parse_variant_positions(variants)
+
+        assert list(parsed_df['parsed_position']) == [17, 42]
+        assert list(parsed_df['description']) == ['a', 'b']
+
     def test_variant_classification_logic(self, sample_variant_data):
         """Test that variants are classified correctly (CRITICAL - this was in the lost plots)."""
         plotter = VariantPlotter()
@@ -117,6 +138,22 @@ class TestConservationVariantPlots:
         # Check that we have the expected number of variants
         assert stats_results['n_variants'] == 5
         assert stats_results['n_background'] == 95  # 100 total - 5 variants
+
+    def test_conservation_variant_effect_size(self, sample_conservation_data, sample_variant_data):
+        """Test Cohen's d matches the two-pass mean/variance definition."""
+        plotter = VariantPlotter()
+        parsed_variants = plotter._parse_variant_positions(sample_variant_data)
+        
+        stats_results = plotter._analyze_variant_conservation(
+            sample_conservation_data, parsed_variants
+        )
+        
+        v = stats_results['variant_conservation']
+        b = stats_results['background_conservation']
+        pooled_std = np.sqrt(((len(v) - 1) * np.var(v, ddof=1) + (len(b) - 1) * np.var(b, ddof=1)) /
+                             (len(v) + len(b) - 2))
+        expected = (np.mean(v) - np.mean(b)) / pooled_std
+        assert stats_results['cohens_d'] == pytest.approx(expected, rel=1e-12)
     
     def test_variant_plot_generation_end_to_end(self, sample_conservation_data, sample_variant_data, temp_output_dir):
         """CRITICAL TEST: End-to-end variant plot generation - this functionality was LOST before."""
@@ -274,6 +311,205 @@ class TestConservationPlotter:
         assert output_path.exists()
         assert '_scientific.png' in output_path.name
 
+    def test_batch_render_settings_do_not_leak(self, tmp_path, conservation_csv_files):
+        """Test the batch rcParams apply only while a scientific plot is built and saved."""
+        import matplotlib as mpl
+
+        csv_file, = conservation_csv_files(("GENEA",), 30)
+        plotter = ConservationPlotter()
+        before = {key: mpl.rcParams[key] for key in ('path.simplify_threshold', 'text.hinting',
+                                                     'agg.path.chunksize')}
+
+        plotter.plot_conservation_with_confidence(csv_file, tmp_path)
+
+        assert {key: mpl.rcParams[key] for key in before} == before
+
+    def test_conservation_plots_reuse_figure(self, tmp_path, conservation_csv_files):
+        """Test reuse_figure keeps one figure across plots until close()."""
+        import matplotlib.pyplot as plt
+
+        csv_files = conservation_csv_files(("GENEA", "GENEB"), 50)
+
+        open_figures = plt.get_fignums()
+        plotter = ConservationPlotter(reuse_figure=True)
+        plotter.plot_conservation_with_confidence(csv_files[0], tmp_path)
+        fig = plotter._fig
+        plotter.plot_conservation_with_confidence(csv_files[1], tmp_path)
+
+        assert plotter._fig is fig
+        assert all((tmp_path / f"{f.stem}_scientific.png").exists() for f in csv_files)
+        # Plotter figures live outside pyplot's figure manager
+        assert plt.get_fignums() == open_figures
+
+        plotter.close()
+        assert plotter._fig is None
+
+    def test_plot_many_reuses_one_figure(self, tmp_path, conservation_csv_files):
+        """Test plot_many saves every file and releases its temporary figure."""
+        csv_files = conservation_csv_files(("GENEA", "GENEB", "GENEC"), 30)
+
+        plotter = ConservationPlotter()
+        with patch.object(ConservationPlotter, '_new_figure',
+                          wraps=ConservationPlotter._new_figure) as new_figure:
+            output_paths = plotter.plot_many(csv_files, tmp_path)
+
+        assert new_figure.call_count == 1
+        assert output_paths == [tmp_path / f"{f.stem}_scientific.png" for f in csv_files]
+        assert all(path.exists() for path in output_paths)
+        assert plotter._fig is None
+        assert not plotter.reuse_figure
+
+    def test_plot_many_to_pdf_writes_one_page_per_file(self, tmp_path, conservation_csv_files):
+        """Test plot_many_to_pdf writes a single multi-page PDF."""
+        import re
+
+        csv_files = conservation_csv_files(("GENEA", "GENEB"), 30)
+
+        plotter = ConservationPlotter()
+        output_path = plotter.plot_many_to_pdf(csv_files, tmp_path / "pdf" / "conservation.pdf")
+
+        assert output_path == tmp_path / "pdf" / "conservation.pdf"
+        content = output_path.read_bytes()
+        assert content.startswith(b"%PDF")
+        assert len(re.findall(rb"/Type\s*/Page\b", content)) == len(csv_files)
+        assert plotter._fig is None
+
+    def test_conservation_csv_cached_until_modified(self, tmp_path):
+        """Test the conservation loader reuses parses until the CSV changes."""
+        conservation_csv = tmp_path / "cached_conservation.csv"
+        pd.DataFrame({
+            'Position': [3, 1, 2],
+            'ShannonEntropy_WithGaps': [0.1, 0.2, 0.3],
+            'ShannonEntropy_NoGaps': [0.1, 0.2, 0.3],
+        }).to_csv(conservation_csv, index=False)
+
+        first = _load_conservation(str(conservation_csv), conservation_csv.stat().st_mtime_ns)
+        second = _load_conservation(str(conservation_csv), conservation_csv.stat().st_mtime_ns)
+
+        assert first is second
+        assert list(first.index) == [1, 2, 3]
+        assert list(first['Position']) == [1, 2, 3]
+
+        pd.DataFrame({
+            'Position': [1],
+            'ShannonEntropy_WithGaps': [0.5],
+            'ShannonEntropy_NoGaps': [0.5],
+        }).to_csv(conservation_csv, index=False)
+        new_mtime = conservation_csv.stat().st_mtime_ns + 1
+        os.utime(conservation_csv, ns=(new_mtime, new_mtime))
+
+        reloaded = _load_conservation(str(conservation_csv), conservation_csv.stat().st_mtime_ns)
+        assert reloaded is not first
+        assert len(reloaded) == 1
+
+    def test_conservation_arrays_cached_read_only(self, tmp_path):
+        """Test the plotting arrays are converted once, sorted and read-only."""
+        conservation_csv = tmp_path / "arrays_conservation.csv"
+        pd.DataFrame({
+            'Position': [2, 1, 3],
+            'ShannonEntropy_WithGaps': [0.2, 0.1, 0.3],
+            'ShannonEntropy_NoGaps': [0.5, 0.4, 0.6],
+        }).to_csv(conservation_csv, index=False)
+        mtime_ns = conservation_csv.stat().st_mtime_ns
+
+        arrays = _load_conservation_arrays(str(conservation_csv), mtime_ns)
+
+        assert _load_conservation_arrays(str(conservation_csv), mtime_ns) is arrays
+        assert arrays.positions.dtype == np.int32
+        assert arrays.entropy_nogaps.dtype == np.float32
+        np.testing.assert_array_equal(arrays.positions, [1, 2, 3])
+        np.testing.assert_allclose(arrays.entropy_nogaps, [0.4, 0.5, 0.6], rtol=1e-6)
+        assert not arrays.entropy_gaps.flags.writeable
+
+    def test_conservation_legend_counts_skip_missing_entropy(self):
+        """Test legend threshold counts ignore NaN entropies like the comparisons they replace."""
+        from matplotlib.figure import Figure
+
+        df = pd.DataFrame({
+            'Position': range(1, 7),
+            'ShannonEntropy_WithGaps': [0.1, 0.2, 1.0, 2.0, 3.0, 0.4],
+            'ShannonEntropy_NoGaps': [0.1, 0.2, 1.0, 2.0, np.nan, 0.4],
+        })
+        ax = Figure().subplots()
+
+        ConservationPlotter()._add_conservation_legend(ax, df)
+
+        labels = [text.get_text() for text in ax.get_legend().get_texts()]
+        assert labels[2].startswith('Highly Conserved: 3/6')
+        assert labels[3].startswith('Moderate: 1/6')
+        assert labels[4].startswith('Variable: 1/6')
+
+    @pytest.mark.parametrize("kernel", [_rolling_std_centered_kernel, _rolling_std_centered_numpy])
+    @pytest.mark.parametrize("window", [1, 2, 5, 40])
+    def test_rolling_std_kernel_matches_pandas(self, kernel, window):
+        """Test both rolling std kernels reproduce pandas' centered min_periods=1 std."""
+        data = np.random.default_rng(0).uniform(0, 4.3, 200)
+        expected = pd.Series(data).rolling(window, center=True, min_periods=1).std().to_numpy()
+
+        result = kernel(data, window)
+
+        np.testing.assert_allclose(result, expected, atol=1e-9, equal_nan=True)
+
+    @pytest.mark.parametrize("kernel", [_rolling_std_centered_kernel, _rolling_std_centered_numpy])
+    @pytest.mark.parametrize("window", [2, 5, 40])
+    def test_rolling_std_kernel_skips_nan_like_pandas(self, kernel, window):
+        """Test missing scores are skipped inside the window instead of poisoning later positions."""
+        data = np.random.default_rng(3).uniform(0, 4.3, 100)
+        data[[0, 11, 12, 50]] = np.nan
+        expected = pd.Series(data).rolling(window, center=True, min_periods=1).std().to_numpy()
+
+        result = kernel(data, window)
+
+        np.testing.assert_allclose(result, expected, atol=1e-9, equal_nan=True)
+
+    def test_vertical_lines_autoscale_like_vlines(self):
+        """Test the LineCollection helper leaves the same view limits as ax.vlines."""
+        from matplotlib.figure import Figure
+
+        x = np.array([10.0, 25.0, 50.0])
+        expected_ax, ax = Figure().subplots(1, 2)
+        expected_ax.vlines(x, 0.2, 2.1)
+
+        _vertical_lines(ax, x, 0.2, 2.1)
+
+        assert ax.get_xlim() == pytest.approx(expected_ax.get_xlim())
+        assert ax.get_ylim() == pytest.approx(expected_ax.get_ylim())
+
+    @pytest.mark.parametrize("lookup", [[], [5], [1, 7, 40, 99]])
+    def test_sorted_membership_matches_isin(self, lookup):
+        """Test the binary-search membership mask agrees with np.isin."""
+        values = np.array([0, 1, 5, 7, 7.5, 40, 99, 100, 3])
+        sorted_unique = np.asarray(lookup, dtype=np.int64)
+
+        np.testing.assert_array_equal(_sorted_membership(values, sorted_unique),
+                                      np.isin(values, sorted_unique))
+
+    @pytest.mark.parametrize("window", [3, 7])
+    def test_boxcar_smooth_matches_centered_rolling_mean(self, window):
+        """Test the cumulative-sum moving average matches pandas' centered rolling mean."""
+        data = np.random.default_rng(2).uniform(0, 4.3, (2, 40))
+        expected = np.stack([
+            pd.Series(row).rolling(window, center=True, min_periods=1).mean().to_numpy()
+            for row in data
+        ])
+
+        np.testing.assert_allclose(_boxcar_smooth(data, window), expected, atol=1e-12)
+
+    def test_unknown_smoothing_method_rejected(self):
+        """Test a misspelled smoothing method fails instead of silently using savgol."""
+        from comparative_genomics_pipeline.visualization.plot_config import PlotConfig
+
+        assert PlotConfig(conservation_smoothing_method='boxcar').conservation_smoothing_method == 'boxcar'
+        with pytest.raises(ValueError, match="conservation_smoothing_method"):
+            PlotConfig(conservation_smoothing_method='boxcr')
+
+    def test_cluster_starts_kernel_hops_cluster_to_cluster(self):
+        """Test the cluster sweep starts a new cluster past each cluster's end."""
+        sorted_positions = np.array([1, 3, 11, 12, 30, 45, 46, 100])
+        cluster_ends = np.searchsorted(sorted_positions, sorted_positions + 10, side='right')
+
+        np.testing.assert_array_equal(_cluster_starts_kernel(cluster_ends), [0, 3, 4, 5, 7])
+
 
 class TestPhylogeneticPlotter:
     """Tests for phylogenetic tree plotting."""
@@ -283,6 +519,44 @@ class TestPhylogeneticPlotter:
         plotter = PhylogeneticPlotter()
         assert plotter is not None
 
+    def test_species_name_uses_first_configured_id_in_clade_name(self):
+        """Test a clade name holding two IDs is labelled by the first ID in configuration order."""
+        from Bio.Phylo.BaseTree import Clade
+        from comparative_genomics_pipeline.visualization.scientific_plots import _load_species_name_map
+
+        config = {"SCN1A": [
+            {"species": "Homo sapiens", "uniprot_id": "P35498"},
+            {"species": "Mus musculus", "uniprot_id": "A2APX8"},
+        ]}
+        _load_species_name_map.cache_clear()
+        try:
+            with patch('comparative_genomics_pipeline.util.file_util.open_file_return_as_json',
+                       return_value=config):
+                label = PhylogeneticPlotter()._format_species_name(Clade(name="A2APX8_P35498"))
+        finally:
+            _load_species_name_map.cache_clear()
+
+        assert label == "Human (H. sapiens)\nP35498"
+
+    def test_draw_tree_uses_single_line_collection(self):
+        """Test the tree is drawn as one LineCollection with Phylo.draw's layout."""
+        from io import StringIO
+        from Bio import Phylo
+        from matplotlib.figure import Figure
+
+        tree = Phylo.read(StringIO("((A:0.1,B:0.2):0.05,C:0.3);"), 'newick')
+        ax = Figure().subplots()
+        PhylogeneticPlotter()._draw_tree(ax, tree)
+
+        assert len(ax.collections) == 1
+        # 5 clades -> 5 horizontal branches + 2 vertical connectors
+        assert len(ax.collections[0].get_segments()) == 7
+        labels = {t.get_text().strip(): t.get_position() for t in ax.texts}
+        assert labels['A'] == pytest.approx((0.15, 1.0))
+        assert labels['B'] == pytest.approx((0.25, 2.0))
+        assert labels['C'] == pytest.approx((0.3, 3.0))
+        assert ax.get_ylim() == pytest.approx((3.8, 0.2))
+
 
 class TestClinVarPlotter:
     """Tests for ClinVar variant plotting."""
@@ -292,6 +566,40 @@ class TestClinVarPlotter:
         plotter = ClinVarPlotter()
         assert plotter is not None
 
+    def test_count_clinical_significance(self):
+        """Test compound classes win and counts follow the fixed category order."""
+        plotter = ClinVarPlotter()
+        df = pd.DataFrame({'clinical_significance': [
+            'Uncertain significance', 'Likely pathogenic', 'Pathogenic',
+            'Uncertain significance', 'Benign/Likely benign', None, 'Pathogenic/Likely pathogenic',
+        ]})
+
+        counts = plotter._count_clinical_significance(df)
+
+        assert counts == {'Uncertain': 2, 'Likely Pathogenic': 2, 'Pathogenic': 1,
+                          'Likely Benign': 1, 'Other': 1}
+        assert list(counts) == ['Pathogenic', 'Likely Pathogenic', 'Likely Benign', 'Uncertain', 'Other']
+
+    def test_clinvar_plots_reuse_two_column_figure(self, tmp_path):
+        """Test reuse_figure keeps the 1 x 2 ClinVar figure across calls."""
+        scn1a_csv = tmp_path / "SCN1A_clinvar_variants.csv"
+        depdc5_csv = tmp_path / "DEPDC5_clinvar_variants.csv"
+        for csv_path in (scn1a_csv, depdc5_csv):
+            pd.DataFrame({'clinical_significance': ['Pathogenic', 'Benign', 'Pathogenic']}).to_csv(
+                csv_path, index=False)
+
+        plotter = ClinVarPlotter(reuse_figure=True)
+        plotter.plot_clinvar_variants(scn1a_csv, depdc5_csv, tmp_path)
+        fig = plotter._fig
+        plotter.plot_clinvar_variants(scn1a_csv, depdc5_csv, tmp_path)
+
+        assert plotter._fig is fig
+        assert len(fig.axes) == 2
+        assert (tmp_path / "clinvar_variants_comparison.png").exists()
+
+        plotter.close()
+        assert plotter._fig is None
+
 
 class TestPlotFileExistence:
     """Tests to ensure critical plot files exist and are maintained."""